@@ -36,10 +36,13 @@ class GCMonitor:
         threading.Thread(target=self.__run, daemon=True).start()
 
     def __run(self):
+        get_stats = gc.get_stats
         while not self.__stop.wait(self.interval):
-            curr = gc.get_stats()
-            print(f"GC (last: {self.interval}s): ")
-            for i in range(len(curr)):
-                c = curr[i]["collections"] - self._prev[i]["collections"]
-                self.send_metric(f"Gen{i}: {c} runs")
+            curr = get_stats()
+            self.send_metric(
+                {
+                    f"gen{i}": gen["collections"] - prev["collections"]
+                    for i, (gen, prev) in enumerate(zip(curr, self._prev))
+                }
+            )
             self._prev = curr
@@ -18,6 +18,9 @@ class IcecreamLogger(BaseLogger):
     ):
         """Initialize the logger."""
         self.log_level = log_level
+        # info/debug have the same shape as ic, so skip the method frame;
+        # error/warning stay methods because they drop exc_info
+        self.info = self.debug = ic  # type: ignore[method-assign]
 
     def info(self, message: str, *args: object) -> None:  # type: ignore[override]
         """Log an info message."""
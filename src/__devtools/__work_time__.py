@@ -1,19 +1,26 @@
 # -*- coding: utf-8 -*-
 
 from functools import wraps
+import os
 import time
 
 
+# JAM_WORK_TIME=0 turns the decorator into a no-op, without the wrapper call
+_ENABLED = os.environ.get("JAM_WORK_TIME", "1") != "0"
+
+
 def work_time(func):
     """Decorator for displaying the function execution time."""
+    if not _ENABLED:
+        return func
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.perf_counter()
-        result = func(*args, **kwargs)
-        end_time = time.perf_counter()
-        execution_time = end_time - start_time
-        print(f"'{func.__name__}': {execution_time:.6f}")
-        return result
+        start_time = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            execution_time = (time.perf_counter_ns() - start_time) / 1e9
+            print(f"'{func.__name__}': {execution_time:.6f}")
 
     return wrapper
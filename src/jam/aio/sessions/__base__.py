@@ -14,6 +14,11 @@ from jam.logger import BaseLogger
 from jam.utils.config_maker import __key_loader__
 
 
+def _passthrough(data: str) -> str:
+    """Return session ID unchanged, used when encryption is off."""
+    return data
+
+
 class BaseAsyncSessionModule(ABC):
     """Abstract base class for async session management modules."""
 
@@ -36,7 +41,15 @@ class BaseAsyncSessionModule(ABC):
             assert session_aes_secret is not None
             if isinstance(session_aes_secret, str):
                 session_aes_secret = __key_loader__(session_aes_secret)
+            # Issued session IDs and stored data are Fernet tokens, so the
+            # cipher is part of the persisted format and must not change
+            # without a migration path.
             self._code_session_key = Fernet(session_aes_secret)
+        else:
+            # Nothing to encode: bind pass-throughs once instead of
+            # checking for the cipher on every session operation.
+            self.__encode_session_id_if_needed__ = _passthrough
+            self.__decode_session_id_if_needed__ = _passthrough
 
     def __encode_session_id__(self, data: str) -> str:
         """Encode the session using AES encryption."""
@@ -86,10 +99,12 @@ class BaseAsyncSessionModule(ABC):
         data_json = self._serializer.dumps(data).decode("utf-8")
         return self.__encode_session_id__(data_json)
 
-    def __decode_session_data__(self, data: str) -> dict:
+    def __decode_session_data__(self, data: str | bytes) -> dict:
         """Decode session data."""
         if not hasattr(self, "_code_session_key"):
             raise AttributeError("Session key encoding is not enabled.")
+        if isinstance(data, bytes):
+            data = data.decode("ascii")
         data = self.__decode_session_id__(data)
         return self._serializer.loads(data)
 
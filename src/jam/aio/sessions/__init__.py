@@ -67,6 +67,7 @@ def create_instance(
             session_aes_secret=session_aes_secret,
             id_factory=id_factory,
             serializer=serializer,
+            layout=kwargs.get("layout", "hash"),
         )
     elif session_type == "json":
         from jam.aio.sessions.json import JSONSessions
@@ -9,6 +9,11 @@ try:
 except ImportError:
     pass
 
+try:
+    import orjson
+except ImportError:
+    pass
+
 from jam.__base_encoder__ import BaseEncoder
 
 
@@ -45,3 +50,20 @@ class MsgspecJsonEncoder(BaseEncoder):
         return msgspec.json.decode(
             var if isinstance(var, bytes) else var.encode("utf-8")
         )
+
+
+class OrjsonEncoder(BaseEncoder):
+    """JSON encoder based on orjson.
+
+    To use it, you need to install the optional orjson: `pip install orjson`
+    """
+
+    @classmethod
+    def dumps(cls, var: dict[str, Any]) -> bytes:
+        """Dump dict."""
+        return orjson.dumps(var)
+
+    @classmethod
+    def loads(cls, var: str | bytes) -> dict[str, Any]:
+        """Load JSON to dict."""
+        return orjson.loads(var)
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
-
-import base64
+from jam.utils.b64codec import urlsafe_b64decode, urlsafe_b64encode
 
 
 def __base64url_encode__(data: bytes) -> str:
@@ -15,7 +14,7 @@ def __base64url_encode__(data: bytes) -> str:
     Returns:
         str: A URL-safe Base64 encoded string without padding.
     """
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("utf-8")
+    return urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
 
 def __base64url_decode__(data: str) -> bytes:
@@ -29,5 +28,4 @@ def __base64url_decode__(data: str) -> bytes:
     Returns:
         bytes: The decoded byte data.
     """
-    padding = "=" * ((4 - len(data) % 4) % 4)
-    return base64.urlsafe_b64decode(data + padding)
+    return urlsafe_b64decode(data + "=" * (-len(data) & 3))
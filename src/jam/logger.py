@@ -49,6 +49,14 @@ class BaseLogger(ABC):
         """Log a debug message."""
         raise NotImplementedError
 
+    def is_debug_enabled(self) -> bool:
+        """Whether debug messages are emitted.
+
+        Lets callers skip building expensive debug arguments. Defaults to
+        True, so custom loggers keep receiving every message.
+        """
+        return True
+
 
 class JamLogger(BaseLogger):
     """Default jam logger, use stdlib logging."""
@@ -97,6 +105,10 @@ class JamLogger(BaseLogger):
         else:
             self.logger.debug(message)
 
+    def is_debug_enabled(self) -> bool:
+        """Whether debug messages are emitted."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
     def __str__(self) -> str:
         """Return a string representation of the logger."""
         return f"JamLogger({self.logger.name})"
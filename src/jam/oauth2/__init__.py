@@ -2,15 +2,20 @@
 
 """OAuth2 module."""
 
-from typing import Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .__base__ import BaseOAuth2Client
-from .builtin.github import GitHubOAuth2Client
-from .builtin.gitlab import GitLabOAuth2Client
-from .builtin.google import GoogleOAuth2Client
-from .builtin.yandex import YandexOAuth2Client
 from jam.encoders import BaseEncoder, JsonEncoder
 from jam.logger import BaseLogger, logger
+from jam.utils.config_maker import __module_loader__
+
+
+if TYPE_CHECKING:
+    from .builtin.github import GitHubOAuth2Client
+    from .builtin.gitlab import GitLabOAuth2Client
+    from .builtin.google import GoogleOAuth2Client
+    from .builtin.yandex import YandexOAuth2Client
 
 
 BUILTIN_PROVIDERS = {
@@ -21,6 +26,23 @@ BUILTIN_PROVIDERS = {
 }
 
 
+_LAZY_CLIENTS = {
+    "GitHubOAuth2Client": ".builtin.github",
+    "GitLabOAuth2Client": ".builtin.gitlab",
+    "GoogleOAuth2Client": ".builtin.google",
+    "YandexOAuth2Client": ".builtin.yandex",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import builtin provider clients on first access."""
+    if name in _LAZY_CLIENTS:
+        value = getattr(import_module(_LAZY_CLIENTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def create_instance(
     providers: dict[str, dict],
     logger: BaseLogger = logger,
@@ -38,8 +60,6 @@ def create_instance(
     Returns:
         dict: {provider_name: OAuth2Client instance}
     """
-    from jam.utils.config_maker import __module_loader__
-
     result = {}
     for name, cfg in providers.items():
         cfg = cfg.copy()  # Don't modify original config
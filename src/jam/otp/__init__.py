@@ -10,6 +10,7 @@ from .__base__ import BaseOTP
 from .hotp import HOTP
 from .totp import TOTP
 from jam.logger import BaseLogger, logger
+from jam.utils.config_maker import __module_loader__
 
 
 def create_instance(
@@ -28,10 +29,6 @@ def create_instance(
         HOTP or TOTP class
     """
     if kwargs.get("custom_module"):
-        from jam.utils.config_maker import __module_loader__
-
         return __module_loader__(kwargs["custom_module"])  # type: ignore[return-value]
 
-    from jam.utils.config_maker import __module_loader__
-
     return __module_loader__(f"jam.otp.{type}.{type.upper()}")  # type: ignore[return-value]
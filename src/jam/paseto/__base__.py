@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC, abstractmethod
+from functools import partial
 from typing import Any, Literal, TypeVar
 
 from cryptography.hazmat.primitives import serialization
@@ -15,6 +16,21 @@ from jam.exceptions import JamPASETOInvalidRSAKey
 PASETO = TypeVar("PASETO", bound="BasePASETO")
 RSAKeyLike = str | bytes | rsa.RSAPrivateKey | rsa.RSAPublicKey
 
+_PEM_PRIVATE_PREFIXES_B = (
+    b"-----BEGIN PRIVATE",
+    b"-----BEGIN RSA PRIVATE",
+    b"-----BEGIN EC PRIVATE",
+)
+_PEM_PRIVATE_PREFIXES_S = tuple(p.decode() for p in _PEM_PRIVATE_PREFIXES_B)
+
+# (is_pem, is_private) -> loader
+_KEY_LOADERS = {
+    (True, True): partial(serialization.load_pem_private_key, password=None),
+    (True, False): serialization.load_pem_public_key,
+    (False, True): partial(serialization.load_der_private_key, password=None),
+    (False, False): serialization.load_der_public_key,
+}
+
 
 class BasePASETO(ABC):
     """Base PASETO instance."""
@@ -56,69 +72,70 @@ class BasePASETO(ABC):
             key_bytes: bytes = key.encode("utf-8")
         else:
             key_bytes = key
+        is_pem, _ = BasePASETO._sniff_key(key_bytes)
         try:
-            if private:
-                return serialization.load_pem_private_key(
-                    key_bytes, password=None
-                )  # type: ignore[no-any-return]
-            else:
-                return serialization.load_pem_public_key(key_bytes)  # type: ignore[no-any-return]
-        except ValueError:
-            try:
-                if private:
-                    return serialization.load_der_private_key(
-                        key_bytes,
-                        password=None,  # type: ignore[arg-type]
-                    )
-                else:
-                    return serialization.load_der_public_key(key_bytes)  # type: ignore[arg-type]
-            except Exception as e:
-                raise JamPASETOInvalidRSAKey(
-                    message=f"Invalid RSA {'private' if private else 'public'} key format.",
-                    details={"error": str(e)},
-                )
+            return _KEY_LOADERS[(is_pem, private)](key_bytes)
+        except Exception as e:
+            raise JamPASETOInvalidRSAKey(
+                message=f"Invalid RSA {'private' if private else 'public'} key format.",
+                details={"error": str(e)},
+            )
+
+    @staticmethod
+    def _sniff_key(raw: bytes) -> tuple[bool, bool]:
+        """Detect key encoding and kind without trial parsing.
+
+        PEM is recognized by its armor (leading whitespace is ignored, as
+        `cryptography` does), DER private keys (PKCS#1, PKCS#8, SEC1) by the
+        small version INTEGER right after the outer SEQUENCE.
+
+        Args:
+            raw (bytes): PEM or DER key material
+
+        Returns:
+            tuple[bool, bool]: (is_pem, is_private)
+        """
+        stripped = raw.lstrip()
+        if stripped.startswith(b"-----BEGIN"):
+            return True, b"PRIVATE" in stripped[:40]
+        if len(raw) < 2:
+            return False, False
+        offset = 2 + (raw[1] & 0x7F if raw[1] & 0x80 else 0)
+        return False, raw[offset : offset + 2] == b"\x02\x01"
 
     @staticmethod
     def _rsa_pem_check(key: RSAKeyLike) -> bool:
         if isinstance(key, str):
-            if key.startswith("-----BEGIN PRIVATE"):
-                return True
-            elif key.startswith("-----BEGIN RSA PRIVATE"):
-                return True
-            elif key.startswith("-----BEGIN EC PRIVATE"):
-                return True
-        elif isinstance(key, bytes):
-            if key.startswith(b"-----BEGIN PRIVATE"):
-                return True
-            elif key.startswith(b"-----BEGIN RSA PRIVATE"):
-                return True
-            elif key.startswith(b"-----BEGIN EC PRIVATE"):
-                return True
-        elif isinstance(key, rsa.RSAPrivateKey):
-            return True
-        return False
+            return key.startswith(_PEM_PRIVATE_PREFIXES_S)
+        if isinstance(key, bytes | bytearray):
+            return key.startswith(_PEM_PRIVATE_PREFIXES_B)
+        return isinstance(key, rsa.RSAPrivateKey)
 
     @staticmethod
     def _encrypt(key: bytes, nonce: bytes, data: bytes) -> bytes:
-        """Encrypt data using AES-256-CTR."""
-        try:
-            cipher = Cipher(algorithms.AES(key), modes.CTR(nonce))
-            encryptor = cipher.encryptor()
-            ciphertext = encryptor.update(data) + encryptor.finalize()
-            return ciphertext
-        except Exception as e:
-            raise ValueError(f"Failed to encrypt: {e}")
+        """Encrypt data using AES-256-CTR.
+
+        Keys and nonces are derived internally with fixed sizes, so
+        there is no invalid input to guard against here. The key is
+        unique per nonce, so AES key objects are not cached: a cache
+        would never hit and would only keep derived keys in memory.
+        """
+        cipher = Cipher(algorithms.AES(key), modes.CTR(nonce))
+        encryptor = cipher.encryptor()
+        # CTR is a stream mode: update() already returns the whole
+        # output and finalize() never yields extra bytes.
+        ciphertext = encryptor.update(data)
+        encryptor.finalize()
+        return ciphertext
 
     @staticmethod
     def _decrypt(key: bytes, nonce: bytes, data: bytes) -> bytes:
         """Decrypt data using AES-256-CTR."""
-        try:
-            cipher = Cipher(algorithms.AES(key), modes.CTR(nonce))
-            decryptor = cipher.decryptor()
-            plaintext = decryptor.update(data) + decryptor.finalize()
-            return plaintext
-        except Exception as e:
-            raise ValueError(f"Failed to decrypt: {e}")
+        cipher = Cipher(algorithms.AES(key), modes.CTR(nonce))
+        decryptor = cipher.decryptor()
+        plaintext = decryptor.update(data)
+        decryptor.finalize()
+        return plaintext
 
     @classmethod
     @abstractmethod
@@ -2,15 +2,36 @@
 
 """PASETO auth* tokens."""
 
-import os
-from typing import Any, Literal
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Literal
 
 from .__base__ import PASETO, BasePASETO
-from .v1 import PASETOv1
-from .v2 import PASETOv2
-from .v3 import PASETOv3
-from .v4 import PASETOv4
 from jam.logger import BaseLogger, logger
+from jam.utils.config_maker import __module_loader__
+
+
+if TYPE_CHECKING:
+    from .v1 import PASETOv1
+    from .v2 import PASETOv2
+    from .v3 import PASETOv3
+    from .v4 import PASETOv4
+
+
+_LAZY_VERSIONS = {
+    "PASETOv1": ".v1",
+    "PASETOv2": ".v2",
+    "PASETOv3": ".v3",
+    "PASETOv4": ".v4",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import version classes on first access."""
+    if name in _LAZY_VERSIONS:
+        value = getattr(import_module(_LAZY_VERSIONS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_instance(
@@ -32,12 +53,6 @@ def create_instance(
     Returns:
         PASETO instance
     """
-    from jam.utils.config_maker import __module_loader__
-
-    if isinstance(secret_key, str) and os.path.isfile(secret_key):
-        with open(secret_key) as f:
-            key = f.read()
-
     if kwargs.get("custom_module"):
         module_cls = __module_loader__(kwargs["custom_module"])
         return module_cls.key(purpose, secret_key)  # type: ignore[no-any-return]
@@ -1,46 +1,83 @@
 # -*- coding: utf-8 -*-
 
-import base64
-from datetime import datetime
-import hashlib
 import hmac
+import os
+from struct import pack_into
+import threading
+import time
 from typing import Any
 from uuid import uuid4
 
 from jam.exceptions import JamPASETOInvalidSymmetricKey
+from jam.utils.b64codec import urlsafe_b64decode, urlsafe_b64encode
+
+
+_LE64_MASK = (1 << 63) - 1
+
+
+class _NoncePool:
+    """Buffered CSPRNG output for PASETO nonces.
+
+    Reads entropy from the OS in blocks and hands out slices, so encoding
+    a token does not cost a `getrandom` syscall each time. Every byte is
+    handed out once; the pool is dropped in forked children so they never
+    reuse the parent's buffer.
+    """
+
+    def __init__(self, size: int = 4096) -> None:
+        self._size = size
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._buf = b""
+        self._pos = 0
+
+    def take(self, n: int) -> bytes:
+        """Return `n` fresh random bytes."""
+        with self._lock:
+            pos = self._pos
+            if pos + n > len(self._buf):
+                self._buf = os.urandom(max(self._size, n))
+                pos = 0
+            self._pos = pos + n
+            return self._buf[pos : pos + n]
+
+
+_NONCE_POOL = _NoncePool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_NONCE_POOL._reset)
+
+
+def __random_bytes__(n: int) -> bytes:
+    """Return `n` random bytes for a nonce."""
+    return _NONCE_POOL.take(n)
 
 
 def __b64url_nopad__(b: bytes) -> str:
     """Return B64 nopad."""
-    return base64.urlsafe_b64encode(b).rstrip(b"=").decode("ascii")
+    return base64url_encode(b).decode("ascii")
 
 
 def __gen_hash__(key: bytes, msg: bytes, hash_size: int = 0) -> bytes:
     """Generate hash."""
-    try:
-        hash_ = hmac.new(key, msg, hashlib.sha384).digest()
-        return hash_[0:hash_size] if hash_size > 0 else hash_
-    except Exception as e:
-        raise ValueError(f"Failed to generate hash: {e}")
+    hash_ = hmac.digest(key, msg, "sha384")
+    return hash_[0:hash_size] if hash_size > 0 else hash_
 
 
 def __pae__(pieces: list[bytes]) -> bytes:
     """Pre-Authentication Encoding (PAE) as per PASETO spec."""
-
-    def le64(n: int) -> bytes:
-        s = bytearray(8)
-        for i in range(8):
-            if i == 7:
-                n = n & 127
-            s[i] = n & 255
-            n = n >> 8
-        return bytes(s)
-
-    output = le64(len(pieces))
+    # LE64 with the top bit cleared, written into one preallocated buffer
+    buf = bytearray(8 + sum(8 + len(piece) for piece in pieces))
+    pack_into("<Q", buf, 0, len(pieces) & _LE64_MASK)
+    offset = 8
     for piece in pieces:
-        output += le64(len(piece))
-        output += piece
-    return output
+        size = len(piece)
+        pack_into("<Q", buf, offset, size & _LE64_MASK)
+        offset += 8
+        buf[offset : offset + size] = piece
+        offset += size
+    return bytes(buf)
 
 
 def base64url_decode(v: str | bytes) -> bytes:
@@ -50,10 +87,7 @@ def base64url_decode(v: str | bytes) -> bytes:
             bv = v
         else:
             bv = v.encode("ascii")
-        rem = len(bv) % 4
-        if rem > 0:
-            bv += b"=" * (4 - rem)
-        return base64.urlsafe_b64decode(bv)
+        return urlsafe_b64decode(bv + b"=" * (-len(bv) & 3))
     except Exception as e:
         raise JamPASETOInvalidSymmetricKey(
             message=f"Failed to decode base64url: {e}"
@@ -66,7 +100,7 @@ def base64url_encode(data: bytes | str) -> bytes:
         bv = data
     else:
         bv = data.encode("ascii")
-    return base64.urlsafe_b64encode(bv).replace(b"=", b"")
+    return urlsafe_b64encode(bv).rstrip(b"=")
 
 
 # init_paseto_instance has been removed and replaced with jam.paseto.create_instance
@@ -94,11 +128,10 @@ def payload_maker(expire: int | None, data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict: Payload
     """
-    now = datetime.now().timestamp()
-    _payload = {
+    now = time.time()
+    return {
         "iat": now,
         "exp": (expire + now) if expire else None,
         "pit": str(uuid4()),
+        **data,
     }
-
-    return _payload | data
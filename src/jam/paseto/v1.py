@@ -1,18 +1,16 @@
 # -*- coding: utf-8 -*-
 # type: ignore
 
-import hashlib
 import hmac
-import secrets
 from typing import Any, Literal
 
-from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.asymmetric.rsa import (
     RSAPrivateKey,
     RSAPublicKey,
 )
-from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.kdf.hkdf import HKDFExpand
 
 from jam.__base_encoder__ import BaseEncoder
 from jam.encoders import JsonEncoder
@@ -22,10 +20,11 @@ from jam.exceptions import (
     JamPASTOKeyVerificationError,
 )
 from jam.exceptions.paseto import JamPASETOInvalidPurpose
-from jam.paseto.__base__ import PASETO, BasePASETO
+from jam.paseto.__base__ import _KEY_LOADERS, PASETO, BasePASETO
 from jam.paseto.utils import (
     __gen_hash__,
     __pae__,
+    __random_bytes__,
     base64url_decode,
     base64url_encode,
 )
@@ -36,6 +35,9 @@ class PASETOv1(BasePASETO):
     """Paseto v1 factory."""
 
     _VERSION = "v1"
+    _LOCAL_PREFIX = "v1.local"
+    _PUBLIC_PREFIX = "v1.public"
+    _header = ""
 
     @classmethod
     def key(
@@ -57,6 +59,10 @@ class PASETOv1(BasePASETO):
         """
         inst = cls()
         inst._purpose = purpose
+        inst._header = f"{cls._VERSION}.{purpose}."
+        inst._encode_impl = (
+            inst._encode_local if purpose == "local" else inst._encode_public
+        )
 
         if purpose == "local":
             if isinstance(secret_key, str):
@@ -64,7 +70,7 @@ class PASETOv1(BasePASETO):
                 raw = base64url_decode(secret_key.encode("utf-8"))
             else:
                 raw = secret_key
-            if not isinstance(raw, (bytes, bytearray) or len(raw) != 32):  # type: ignore[bad-argument-type]
+            if not isinstance(raw, bytes | bytearray):
                 raise JamPASETOInvalidRSAKey(
                     message="v1.local requires a 32-byte secret key.",
                     details={
@@ -94,43 +100,17 @@ class PASETOv1(BasePASETO):
                 else secret_key
             )
             try:
-                priv = serialization.load_pem_private_key(
-                    key_bytes,  # type: ignore[arg-type]
-                    password=None,
-                )
-                if isinstance(priv, RSAPrivateKey):
-                    inst._secret = priv
-                    inst._public_key = priv.public_key()
-                    return inst
-            except Exception:
-                pass
-            try:
-                priv = serialization.load_der_private_key(  # type: ignore[arg-type]
-                    key_bytes,
-                    password=None,
-                )
-                if isinstance(priv, RSAPrivateKey):
-                    inst._secret = priv
-                    inst._public_key = priv.public_key()
-                    return inst
-            except Exception:
-                pass
-            try:
-                pub = serialization.load_pem_public_key(key_bytes)  # type: ignore[arg-type]
-                if isinstance(pub, RSAPublicKey):
-                    inst._secret = None
-                    inst._public_key = pub
-                    return inst
+                loaded = _KEY_LOADERS[cls._sniff_key(key_bytes)](key_bytes)
             except Exception:
-                pass
-            try:
-                pub = serialization.load_der_public_key(key_bytes)  # type: ignore[arg-type]
-                if isinstance(pub, RSAPublicKey):
-                    inst._secret = None
-                    inst._public_key = pub
-                    return inst
-            except Exception:
-                pass
+                loaded = None
+            if isinstance(loaded, RSAPrivateKey):
+                inst._secret = loaded
+                inst._public_key = loaded.public_key()
+                return inst
+            if isinstance(loaded, RSAPublicKey):
+                inst._secret = None
+                inst._public_key = loaded
+                return inst
 
             raise JamPASETOInvalidRSAKey(
                 message="Invalid RSA key for v1.public"
@@ -138,6 +118,31 @@ class PASETOv1(BasePASETO):
         else:
             raise ValueError("Purpose must be 'local' or 'public'")
 
+    def _encode_impl(self, header: str, payload: bytes, footer: bytes) -> bytes:
+        """Fallback for instances created without `key()`."""
+        raise JamPASETOInvalidPurpose
+
+    def _derive_keys(self, salt: bytes) -> tuple[bytes, bytes]:
+        """Derive encryption and authentication keys for a nonce.
+
+        Both keys come from the same HKDF-SHA384 extract step, so the PRK
+        is computed once and only the expand step runs per key.
+
+        Args:
+            salt (bytes): First half of the nonce
+
+        Returns:
+            tuple[bytes, bytes]: Encryption key, authentication key
+        """
+        prk = hmac.digest(salt, self._secret, "sha384")
+        ek = HKDFExpand(hashes.SHA384(), 32, b"paseto-encryption-key").derive(
+            prk
+        )
+        ak = HKDFExpand(
+            hashes.SHA384(), 32, b"paseto-auth-key-for-aead"
+        ).derive(prk)
+        return ek, ak
+
     def _encode_local(
         self,
         header: str,
@@ -145,29 +150,21 @@ class PASETOv1(BasePASETO):
         footer: bytes,
     ) -> bytes:
         header_bytes = header.encode("ascii")
-        nonce = secrets.token_bytes(32)
+        nonce = __random_bytes__(32)
         pl = __gen_hash__(nonce, payload, 32)
 
-        hkdf_params = {
-            "algorithm": hashes.SHA384(),
-            "length": 32,
-            "salt": pl[0:16],
-        }
-        ek = HKDF(info=b"paseto-encryption-key", **hkdf_params).derive(  # type: ignore[arg-type]
-            self._secret
-        )
-        ak = HKDF(info=b"paseto-auth-key-for-aead", **hkdf_params).derive(  # type: ignore[arg-type]
-            self._secret
-        )
+        ek, ak = self._derive_keys(pl[0:16])
 
         ciphertext = self._encrypt(ek, pl[16:], payload)
         pre_auth = __pae__([header_bytes, pl, ciphertext, footer])
-        tag = hmac.new(ak, pre_auth, hashlib.sha384).digest()
+        tag = hmac.digest(ak, pre_auth, "sha384")
 
-        token = header_bytes + base64url_encode(pl + ciphertext + tag)
+        encoded = base64url_encode(pl + ciphertext + tag)
         if footer:
-            token += b"." + base64url_encode(footer)
-        return token
+            return b"".join(
+                (header_bytes, encoded, b".", base64url_encode(footer))
+            )
+        return header_bytes + encoded
 
     def _encode_public(
         self, header: str, payload: bytes, footer: bytes
@@ -189,10 +186,12 @@ class PASETOv1(BasePASETO):
                 details={"version": "v1", "error": str(e)}
             )
 
-        token = header_bytes + base64url_encode(payload + signature)
+        encoded = base64url_encode(payload + signature)
         if footer:
-            token += b"." + base64url_encode(footer)
-        return token
+            return b"".join(
+                (header_bytes, encoded, b".", base64url_encode(footer))
+            )
+        return header_bytes + encoded
 
     def _decode_local(self, token: str, serializer):
         """Decode local PASETO."""
@@ -217,27 +216,17 @@ class PASETOv1(BasePASETO):
                 error_code="paseto.validation.invalid_payload_size",
             )
 
-        pl = decoded[:32]
-        ciphertext_tag = decoded[32:]
-        tag = ciphertext_tag[-48:]
-        ciphertext = ciphertext_tag[:-48]
+        view = memoryview(decoded)
+        pl = bytes(view[:32])
+        ciphertext = view[32:-48]
+        tag = view[-48:]
 
         footer_decoded = base64url_decode(footer_part) if footer_part else b""
 
-        hkdf_params = {
-            "algorithm": hashes.SHA384(),
-            "length": 32,
-            "salt": pl[0:16],
-        }
-        ek = HKDF(info=b"paseto-encryption-key", **hkdf_params).derive(  # type: ignore[arg-type]
-            self._secret
-        )
-        ak = HKDF(info=b"paseto-auth-key-for-aead", **hkdf_params).derive(  # type: ignore[arg-type]
-            self._secret
-        )
+        ek, ak = self._derive_keys(pl[0:16])
 
         pre_auth = __pae__([header, pl, ciphertext, footer_decoded])
-        expected_tag = hmac.new(ak, pre_auth, hashlib.sha384).digest()
+        expected_tag = hmac.digest(ak, pre_auth, "sha384")
         if not hmac.compare_digest(tag, expected_tag):
             raise JamPASETOInvalidTokenFormat(
                 message="Invalid authentication tag",
@@ -294,7 +283,7 @@ class PASETOv1(BasePASETO):
             )
 
         payload = decoded[:-key_size]
-        signature = decoded[-key_size:]
+        signature = memoryview(decoded)[-key_size:]
 
         footer_decoded = base64url_decode(footer_part) if footer_part else b""
 
@@ -333,16 +322,11 @@ class PASETOv1(BasePASETO):
         serializer: type[BaseEncoder] | BaseEncoder = JsonEncoder,
     ) -> str:
         """Encode PASETO."""
-        header = f"{self._VERSION}.{self.purpose}."
-        payload = serializer.dumps(payload)
-        footer = serializer.dumps(footer) if footer else b""
-
-        if self._purpose == "local":
-            return self._encode_local(header, payload, footer).decode("utf-8")
-        elif self._purpose == "public":
-            return self._encode_public(header, payload, footer).decode("utf-8")
-        else:
-            raise JamPASETOInvalidPurpose
+        return self._encode_impl(
+            self._header,
+            serializer.dumps(payload),
+            serializer.dumps(footer) if footer else b"",
+        ).decode("utf-8")
 
     def decode(
         self,
@@ -355,9 +339,9 @@ class PASETOv1(BasePASETO):
             token (str): PASETO
             serializer (BaseEncoder): Json serializer
         """
-        if token.startswith(f"{self._VERSION}.local"):
+        if token.startswith(self._LOCAL_PREFIX):
             return self._decode_local(token, serializer)
-        elif token.startswith(f"{self._VERSION}.public"):
+        elif token.startswith(self._PUBLIC_PREFIX):
             return self._decode_public(token, serializer)
         else:
             raise JamPASETOInvalidPurpose
@@ -2,9 +2,10 @@
 # type: ignore
 
 import base64
-import secrets
+from functools import lru_cache
 from typing import Any, Literal
 
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
@@ -18,7 +19,12 @@ from jam.exceptions import (
     JamPASETOInvalidTokenFormat,
 )
 from jam.paseto.__base__ import PASETO, BasePASETO
-from jam.paseto.utils import __pae__, base64url_decode, base64url_encode
+from jam.paseto.utils import (
+    __pae__,
+    __random_bytes__,
+    base64url_decode,
+    base64url_encode,
+)
 from jam.utils.config_maker import __key_loader__
 from jam.utils.xchacha20poly1305 import (
     xchacha20poly1305_decrypt,
@@ -26,10 +32,46 @@ from jam.utils.xchacha20poly1305 import (
 )
 
 
+@lru_cache(maxsize=128)
+def _load_ed25519_pem(pem: bytes) -> Ed25519PrivateKey | Ed25519PublicKey:
+    """Parse Ed25519 PEM key material.
+
+    Cached, so services that call `PASETOv2.key` per request with the
+    same PEM only pay for the ASN.1 parsing once.
+
+    Args:
+        pem (bytes): Private or public PEM
+
+    Raises:
+        JamPASETOInvalidED25519Key: If PEM is not an Ed25519 key
+
+    Returns:
+        Ed25519PrivateKey | Ed25519PublicKey: Loaded key
+    """
+    try:
+        private_key = serialization.load_pem_private_key(pem, password=None)
+        if isinstance(private_key, Ed25519PrivateKey):
+            return private_key
+    except Exception:
+        pass
+    try:
+        public_key = serialization.load_pem_public_key(pem)
+    except Exception:
+        raise JamPASETOInvalidED25519Key
+    if not isinstance(public_key, Ed25519PublicKey):
+        raise JamPASETOInvalidED25519Key(
+            message="Expected Ed25519 public key",
+            error_code="paseto.config.expected_ed25519_public_key",
+        )
+    return public_key
+
+
 class PASETOv2(BasePASETO):
     """PASETO v2 factory."""
 
     _VERSION = "v2"
+    # PAE of the local header with an empty footer, the usual AAD
+    _LOCAL_AAD = __pae__([b"v2.local.", b""])
 
     @classmethod
     def key(
@@ -66,28 +108,14 @@ class PASETOv2(BasePASETO):
             if isinstance(secret_key, str):
                 secret_key = secret_key.encode()
 
-            try:
-                private_key = serialization.load_pem_private_key(
-                    secret_key, password=None
-                )
-                if not isinstance(private_key, Ed25519PrivateKey):
-                    raise ValueError("Expected Ed25519 private key")
-                k._secret = private_key
-                k._public_key = private_key.public_key()
-                return k
-            except Exception:
-                try:
-                    public_key = serialization.load_pem_public_key(secret_key)
-                    if not isinstance(public_key, Ed25519PublicKey):
-                        raise JamPASETOInvalidED25519Key(
-                            message="Expected Ed25519 public key",
-                            error_code="paseto.config.expected_ed25519_public_key",
-                        )
-                    k._secret = None
-                    k._public_key = public_key
-                    return k
-                except Exception:
-                    raise JamPASETOInvalidED25519Key
+            loaded = _load_ed25519_pem(bytes(secret_key))
+            if isinstance(loaded, Ed25519PrivateKey):
+                k._secret = loaded
+                k._public_key = loaded.public_key()
+            else:
+                k._secret = None
+                k._public_key = loaded
+            return k
 
         else:
             raise ValueError("Purpose must be 'local' or 'public'")
@@ -100,17 +128,17 @@ class PASETOv2(BasePASETO):
     ) -> bytes:
         bheader = header.encode("ascii")
         bfooter = footer or b""
-        nonce = secrets.token_bytes(24)
-        aad = __pae__([bheader, bfooter])
+        nonce = __random_bytes__(24)
+        aad = __pae__([bheader, bfooter]) if bfooter else self._LOCAL_AAD
 
         ciphertext = xchacha20poly1305_encrypt(
             self._secret, nonce, payload, aad
         )
 
-        token = bheader + base64url_encode(nonce + ciphertext)
+        encoded = base64url_encode(nonce + ciphertext)
         if bfooter:
-            token += b"." + base64url_encode(bfooter)
-        return token
+            return b"".join((bheader, encoded, b".", base64url_encode(bfooter)))
+        return bheader + encoded
 
     def _encode_public(
         self, header: str, payload: bytes, footer: bytes | None
@@ -127,39 +155,38 @@ class PASETOv2(BasePASETO):
         pre_auth = __pae__([bheader, payload, footer_bytes])
         signature = self._secret.sign(pre_auth)
 
-        token = bheader + base64url_encode(payload + signature)
+        encoded = base64url_encode(payload + signature)
         if footer_bytes:
-            token += b"." + base64url_encode(footer_bytes)
-        return token
+            return b"".join(
+                (bheader, encoded, b".", base64url_encode(footer_bytes))
+            )
+        return bheader + encoded
 
     def _decode_local(
         self,
         token: str,
         serializer: type[BaseEncoder] | BaseEncoder = JsonEncoder,
     ) -> tuple[dict[str, Any], dict[str, Any] | None]:
-        parts = token.encode().split(b".")
-        if len(parts) < 3:
-            raise JamPASETOInvalidTokenFormat
-
-        header = b".".join(parts[:2]) + b"."
-        if header != b"v2.local.":
+        if not token.startswith("v2.local."):
             raise JamPASETOInvalidTokenFormat(
                 message="Invalid PASETO header",
                 error_code="paseto.validation.invalid_header",
             )
 
-        body = base64url_decode(parts[2])
-        footer = base64url_decode(parts[3]) if len(parts) > 3 else b""
+        body_part, _, footer_part = token[9:].partition(".")
+        body = base64url_decode(body_part)
+        footer = base64url_decode(footer_part) if footer_part else b""
 
-        nonce = body[:24]
-        ciphertext = body[24:]
-        aad = __pae__([header, footer])
+        view = memoryview(body)
+        nonce = bytes(view[:24])
+        ciphertext = view[24:]
+        aad = __pae__([b"v2.local.", footer]) if footer else self._LOCAL_AAD
 
         try:
             plaintext = xchacha20poly1305_decrypt(
                 self._secret, nonce, ciphertext, aad
             )
-        except Exception:
+        except (InvalidTag, ValueError):
             raise JamPASETOInvalidED25519Key(
                 "Invalid authentication or corrupt ciphertext"
             )
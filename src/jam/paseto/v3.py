@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # type: ignore
 
-import hashlib
 import hmac
-import secrets
 from typing import Any, Literal
 
 from cryptography.exceptions import InvalidSignature
@@ -27,6 +25,7 @@ from jam.paseto.__base__ import PASETO, BasePASETO
 from jam.paseto.utils import (
     __gen_hash__,
     __pae__,
+    __random_bytes__,
     base64url_decode,
     base64url_encode,
 )
@@ -229,7 +228,7 @@ class PASETOv3(BasePASETO):
         self, header: str, payload: bytes, footer: bytes
     ) -> bytes:
         header_b = header.encode("ascii")
-        nonce = secrets.token_bytes(32)
+        nonce = __random_bytes__(32)
         pl = __gen_hash__(nonce, payload, 32)
 
         hkdf_params = {
@@ -246,13 +245,13 @@ class PASETOv3(BasePASETO):
 
         ciphertext = self._encrypt(ek, pl[16:], payload)
         pre_auth = __pae__([header_b, pl, ciphertext, footer or b""])
-        tag = hmac.new(ak, pre_auth, hashlib.sha384).digest()
+        tag = hmac.digest(ak, pre_auth, "sha384")
 
         body = pl + ciphertext + tag
-        token = header_b + base64url_encode(body)
+        encoded = base64url_encode(body)
         if footer:
-            token += b"." + base64url_encode(footer)
-        return token
+            return b"".join((header_b, encoded, b".", base64url_encode(footer)))
+        return header_b + encoded
 
     def _decode_local(self, token: str, serializer: BaseEncoder):
         parts = token.encode("utf-8").split(b".")
@@ -287,7 +286,7 @@ class PASETOv3(BasePASETO):
         )
 
         pre_auth = __pae__([header, pl, ciphertext, footer_decoded])
-        expected_tag = hmac.new(ak, pre_auth, hashlib.sha384).digest()
+        expected_tag = hmac.digest(ak, pre_auth, "sha384")
         if not hmac.compare_digest(tag, expected_tag):
             raise JamPASETOInvalidTokenFormat(
                 message="Invalid authentication tag"
@@ -326,10 +325,10 @@ class PASETOv3(BasePASETO):
         s_bytes = int.to_bytes(s, 48, "big")
         raw_sig = r_bytes + s_bytes  # 96 bytes
 
-        token = header_b + base64url_encode(payload + raw_sig)
+        encoded = base64url_encode(payload + raw_sig)
         if footer:
-            token += b"." + base64url_encode(footer)
-        return token
+            return b"".join((header_b, encoded, b".", base64url_encode(footer)))
+        return header_b + encoded
 
     def _decode_public(self, token: str, serializer: BaseEncoder):
         parts = token.encode("utf-8").split(b".")
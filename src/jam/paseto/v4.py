@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 # type: ignore
 
-import secrets
 from typing import Any, Literal
 
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
@@ -20,7 +20,12 @@ from jam.exceptions import (
     JamPASTOKeyVerificationError,
 )
 from jam.paseto.__base__ import PASETO, BasePASETO
-from jam.paseto.utils import __pae__, base64url_decode, base64url_encode
+from jam.paseto.utils import (
+    __pae__,
+    __random_bytes__,
+    base64url_decode,
+    base64url_encode,
+)
 from jam.utils.config_maker import __key_loader__
 from jam.utils.xchacha20poly1305 import (
     xchacha20poly1305_decrypt,
@@ -197,16 +202,16 @@ class PASETOv4(BasePASETO):
         self, header: str, payload: bytes, footer: bytes
     ) -> bytes:
         header_b = header.encode("ascii")
-        nonce = secrets.token_bytes(24)
+        nonce = __random_bytes__(24)
         aad = __pae__([header_b, footer or b""])
         ciphertext = xchacha20poly1305_encrypt(
             self._secret, nonce, payload, aad
         )
 
-        token = header_b + base64url_encode(nonce + ciphertext)
+        encoded = base64url_encode(nonce + ciphertext)
         if footer:
-            token += b"." + base64url_encode(footer)
-        return token
+            return b"".join((header_b, encoded, b".", base64url_encode(footer)))
+        return header_b + encoded
 
     def _decode_local(
         self, token: str, serializer: BaseEncoder | type[BaseEncoder]
@@ -232,7 +237,7 @@ class PASETOv4(BasePASETO):
             plaintext = xchacha20poly1305_decrypt(
                 self._secret, nonce, ciphertext, aad
             )
-        except Exception:
+        except (InvalidTag, ValueError):
             raise JamPASTOKeyVerificationError(
                 message="Invalid authentication or corrupt ciphertext"
             )
@@ -264,10 +269,10 @@ class PASETOv4(BasePASETO):
         pre_auth = __pae__([header_b, payload, footer or b""])
         signature = self._secret.sign(pre_auth)  # raw 64 bytes
 
-        token = header_b + base64url_encode(payload + signature)
+        encoded = base64url_encode(payload + signature)
         if footer:
-            token += b"." + base64url_encode(footer)
-        return token
+            return b"".join((header_b, encoded, b".", base64url_encode(footer)))
+        return header_b + encoded
 
     def _decode_public(self, token: str, serializer: BaseEncoder):
         parts = token.encode("utf-8").split(b".")
@@ -57,7 +57,8 @@ def create_instance(
             is_session_crypt=is_session_crypt,
             session_aes_secret=session_aes_secret,
             id_factory=id_factory,
-            serializer=serializer
+            serializer=serializer,
+            layout=kwargs.get("layout", "hash"),
         )
     elif session_type == "json":
         from jam.sessions.json import JSONSessions
@@ -2,11 +2,14 @@
 
 from collections.abc import Callable
 import os
+import re
+from typing import Literal
 from uuid import uuid4
 
 
 try:
-    from redis import Redis
+    from redis import ConnectionPool, Redis
+    from redis.exceptions import ResponseError, WatchError
 except ImportError:
     raise ImportError(
         "Redis module is not installed. Please install it with 'pip install jamlib[redis]'."
@@ -18,6 +21,24 @@ from jam.logger import BaseLogger
 from jam.sessions.__base__ import BaseSessionModule
 
 
+_POOL_CACHE: dict[str, ConnectionPool] = {}
+
+
+def _pool_for(redis_uri: str) -> ConnectionPool:
+    """Return the connection pool shared by all sessions on a Redis URI."""
+    pool = _POOL_CACHE.get(redis_uri)
+    if pool is None:
+        pool = _POOL_CACHE.setdefault(
+            redis_uri, ConnectionPool.from_url(redis_uri)
+        )
+    return pool
+
+
+def _glob_escape(value: str) -> str:
+    """Escape glob metacharacters for a SCAN MATCH pattern."""
+    return re.sub(r"([*?\[\]\\])", r"\\\1", value)
+
+
 class RedisSessions(BaseSessionModule):
     """Redis session management module."""
 
@@ -35,11 +56,13 @@ class RedisSessions(BaseSessionModule):
         id_factory: Callable[[], str] = lambda: str(uuid4()),
         serializer: BaseEncoder | type[BaseEncoder] = JsonEncoder,
         logger: BaseLogger | None = None,
+        layout: Literal["hash", "string"] = "hash",
     ) -> None:
         """Initialize the Redis session management module.
 
         Args:
-            redis_uri (str | Redis): The URI for the Redis server.
+            redis_uri (str | Redis): The URI for the Redis server. Instances
+                created with the same URI share one connection pool.
             redis_sessions_key (str): The key under which sessions are stored in Redis.
             ttl (Optional[int]): Default time-to-live for sessions in seconds. Defaults to 3600 seconds (1 hour).
             is_session_crypt (bool): If True, session keys will be encoded.
@@ -47,6 +70,10 @@ class RedisSessions(BaseSessionModule):
             id_factory (Callable[[], str], optional): A callable that generates unique IDs. Defaults to a UUID factory.
             serializer (Union[BaseEncoder, type[BaseEncoder]], optional): JSON encoder/decoder. Defaults to JsonEncoder.
             logger (Optional[BaseLogger], optional): Logger instance. Defaults to None.
+            layout (Literal["hash", "string"], optional): Storage layout. `hash` keeps
+                sessions as fields of `<path>:<session_key>` with HEXPIRE (Redis 7.4+),
+                `string` stores each session as its own key with a plain TTL.
+                Defaults to `hash`.
 
         Raises:
             JamSessionEmptyAESKey: If 'is_session_crypt' is True and 'session_aes_secret' is not provided.
@@ -59,7 +86,7 @@ class RedisSessions(BaseSessionModule):
             logger=logger,
         )
         if isinstance(redis_uri, str):
-            self._redis = Redis.from_url(redis_uri, decode_responses=True)
+            self._redis = Redis(connection_pool=_pool_for(redis_uri))
         else:
             self._redis = redis_uri
         if self._logger:
@@ -67,6 +94,32 @@ class RedisSessions(BaseSessionModule):
 
         self.ttl = ttl
         self.session_path = redis_sessions_key
+        self._layout = layout
+
+    @property
+    def session_path(self) -> str:
+        """Redis key prefix under which session hashes are stored."""
+        return self._session_path
+
+    @session_path.setter
+    def session_path(self, value: str) -> None:
+        self._session_path = value
+        # Pre-encoded "<path>:" so hash names are a single bytes concat
+        self._session_prefix = f"{value}:".encode()
+
+    def _session_key(self, session_id: str) -> str:
+        """Return the owner key of a session ID.
+
+        The ID is decoded here once per operation; callers build the hash
+        name from the result instead of decoding again.
+        """
+        return self.__decode_session_id_if_needed__(session_id).partition(":")[
+            0
+        ]
+
+    def _string_name(self, session_key: str, session_id: str) -> bytes:
+        """Return the key of a session in the `string` layout."""
+        return self._session_prefix + f"{session_key}:{session_id}".encode()
 
     def _ping(self) -> bool:
         """Check if the Redis connection is alive."""
@@ -100,26 +153,74 @@ class RedisSessions(BaseSessionModule):
             dumps_data = self._serializer.dumps(data).decode("utf-8")
         del data
 
-        self._redis.hset(
-            name=f"{self.session_path}:{session_key}",
-            key=session_id,
-            value=dumps_data,
-        )
+        if self._layout == "string":
+            self._redis.set(
+                self._string_name(session_key, session_id),
+                dumps_data,
+                ex=self.ttl or None,
+            )
+        else:
+            name = self._session_prefix + session_key.encode()
+            pipe = self._redis.pipeline()
+            pipe.hset(name=name, key=session_id, value=dumps_data)
+            if self.ttl:
+                pipe.hexpire(name, self.ttl, session_id)
+            pipe.execute()
         if self._logger:
-            self._logger.debug("Set session %s successfully.", session_id)
-        if self.ttl:
-            self._redis.hexpire(
-                f"{self.session_path}:{session_key}", self.ttl, session_id
+            self._logger.debug(
+                "Set session %s successfully, TTL: %s.", session_id, self.ttl
             )
-            if self._logger:
-                self._logger.debug(
-                    "Set TTL for session %s to %d seconds.",
-                    session_id,
-                    self.ttl,
-                )
 
         return session_id
 
+    def create_many(self, session_key: str, items: list[dict]) -> list[str]:
+        """Create several sessions for one key in a single round trip.
+
+        Args:
+            session_key (str): The key for the sessions.
+            items (list[dict]): Data for each new session.
+
+        Returns:
+            list[str]: IDs of the created sessions, in the order of `items`.
+        """
+        if not items:
+            return []
+
+        name = self._session_prefix + session_key.encode()
+        session_ids = []
+        pipe = self._redis.pipeline()
+        for data in items:
+            session_id = self.__encode_session_id_if_needed__(
+                f"{session_key}:{self.id}"
+            )
+            try:
+                dumps_data = self.__encode_session_data__(data)
+            except AttributeError:
+                dumps_data = self._serializer.dumps(data).decode("utf-8")
+
+            if self._layout == "string":
+                pipe.set(
+                    self._string_name(session_key, session_id),
+                    dumps_data,
+                    ex=self.ttl or None,
+                )
+            else:
+                pipe.hset(name=name, key=session_id, value=dumps_data)
+            session_ids.append(session_id)
+
+        if self.ttl and self._layout == "hash":
+            pipe.hexpire(name, self.ttl, *session_ids)
+        pipe.execute()
+        if self._logger:
+            self._logger.debug(
+                "Set %s sessions for %s successfully, TTL: %s.",
+                len(session_ids),
+                session_key,
+                self.ttl,
+            )
+
+        return session_ids
+
     def get(self, session_id: str) -> dict | None:
         """Retrieve a session by its key or ID.
 
@@ -130,30 +231,38 @@ class RedisSessions(BaseSessionModule):
             dict | None: The session data if found, otherwise None.
         """
         if self._logger:
-            self._logger.debug(f"Getting session with ID: {session_id}")
-        decoded_session_key = self.__decode_session_id_if_needed__(
-            session_id
-        ).split(":", 1)
+            self._logger.debug("Getting session with ID: %s", session_id)
+        session_key = self._session_key(session_id)
         if self._logger:
             self._logger.debug(
-                f"Decoded session key: {decoded_session_key[0]}, looking in Redis key: {self.session_path}:{decoded_session_key[0]}"
+                "Decoded session key: %s, looking in Redis key: %s:%s",
+                session_key,
+                self.session_path,
+                session_key,
+            )
+        if self._layout == "string":
+            session = self._redis.get(
+                self._string_name(session_key, session_id)
+            )
+        else:
+            session = self._redis.hget(
+                name=self._session_prefix + session_key.encode(),
+                key=session_id,
             )
-        session = self._redis.hget(
-            name=f"{self.session_path}:{decoded_session_key[0]}",
-            key=session_id,
-        )
         if not session:
             if self._logger:
-                self._logger.debug(f"Session {session_id} not found in Redis")
+                self._logger.debug("Session %s not found in Redis", session_id)
             return None
 
         try:
             loads_data = self.__decode_session_data__(session)  # type: ignore[arg-type]
         except AttributeError:
             loads_data = self._serializer.loads(session)  # type: ignore[arg-type]
-        if self._logger:
+        if self._logger and self._logger.is_debug_enabled():
             self._logger.debug(
-                f"Session {session_id} found, data keys: {list(loads_data.keys()) if isinstance(loads_data, dict) else 'N/A'}"
+                "Session %s found, data keys: %s",
+                session_id,
+                list(loads_data) if isinstance(loads_data, dict) else "N/A",
             )
         del session
 
@@ -166,26 +275,72 @@ class RedisSessions(BaseSessionModule):
             session_id (str): The session ID.
         """
         if self._logger:
-            self._logger.debug(f"Deleting session with ID: {session_id}")
-        decoded_session_key = self.__decode_session_id_if_needed__(
-            session_id
-        ).split(":", 1)
-        deleted_count = self._redis.hdel(
-            f"{self.session_path}:{decoded_session_key[0]}",
-            session_id,
-        )
+            self._logger.debug("Deleting session with ID: %s", session_id)
+        session_key = self._session_key(session_id)
+        if self._layout == "string":
+            deleted_count = self._redis.delete(
+                self._string_name(session_key, session_id)
+            )
+        else:
+            deleted_count = self._redis.hdel(
+                self._session_prefix + session_key.encode(),
+                session_id,
+            )
         if self._logger:
             self._logger.debug(
-                f"Session {session_id} deleted from Redis, removed {deleted_count} field(s)"
+                "Session %s deleted from Redis, removed %s field(s)",
+                session_id,
+                deleted_count,
             )
 
+    def get_and_delete(self, session_id: str) -> dict | None:
+        """Retrieve a session and delete it in a single round trip.
+
+        The read and the delete go out in one MULTI/EXEC pipeline, so a
+        single-use session can only be consumed once.
+
+        Args:
+            session_id (str): The session ID.
+
+        Returns:
+            dict | None: The session data if found, otherwise None.
+        """
+        session_key = self._session_key(session_id)
+        pipe = self._redis.pipeline()
+        if self._layout == "string":
+            name = self._string_name(session_key, session_id)
+            pipe.get(name)
+            pipe.delete(name)
+        else:
+            name = self._session_prefix + session_key.encode()
+            pipe.hget(name, session_id)
+            pipe.hdel(name, session_id)
+        session, _ = pipe.execute()
+        if not session:
+            if self._logger:
+                self._logger.debug("Session %s not found in Redis", session_id)
+            return None
+        if self._logger:
+            self._logger.debug("Session %s read and deleted.", session_id)
+
+        try:
+            return self.__decode_session_data__(session)
+        except AttributeError:
+            return self._serializer.loads(session)
+
     def clear(self, session_key: str) -> None:
         """Clear all sessions for a given session key.
 
         Args:
             session_key (str): The session key to clear.
         """
-        self._redis.delete(f"{self.session_path}:{session_key}")
+        if self._layout == "string":
+            pattern = _glob_escape(f"{self.session_path}:{session_key}:") + "*"
+            keys = list(self._redis.scan_iter(match=pattern))
+            if keys:
+                self._redis.unlink(*keys)
+        else:
+            self._redis.delete(self._session_prefix + session_key.encode())
         if self._logger:
             self._logger.debug(
                 "All sessions for key '%s' cleared successfully.", session_key
@@ -201,53 +356,67 @@ class RedisSessions(BaseSessionModule):
         Raises:
             JamSessionNotFound: If the session with the given ID does not exist.
         """
-        if self._logger:
+        if self._logger and self._logger.is_debug_enabled():
             self._logger.debug(
-                f"Updating session {session_id} with data keys: {list(data.keys())}"
+                "Updating session %s with data keys: %s",
+                session_id,
+                list(data),
             )
-        decoded_session_key = self.__decode_session_id_if_needed__(
-            session_id
-        ).split(":", 1)
-        if not self.get(session_id):
-            if self._logger:
-                self._logger.warning(
-                    f"Attempted to update non-existent session {session_id}"
-                )
-            raise JamSessionNotFound(details={"session_id": session_id})
-
         try:
             dumps_data = self.__encode_session_data__(data)
         except AttributeError:
             dumps_data = self._serializer.dumps(data).decode("utf-8")
         del data
 
-        self._redis.hset(
-            name=f"{self.session_path}:{decoded_session_key[0]}",
-            key=session_id,
-            value=dumps_data,
-        )
-        if self._logger:
-            self._logger.debug(
-                f"Session {session_id} updated successfully in Redis"
-            )
-
-        if self.ttl:
-            self._redis.hexpire(
-                f"{self.session_path}:{decoded_session_key[0]}",
-                self.ttl,
-                session_id,
+        session_key = self._session_key(session_id)
+        if self._layout == "string":
+            # XX only writes an existing key, so this is the existence check
+            updated = self._redis.set(
+                self._string_name(session_key, session_id),
+                dumps_data,
+                ex=self.ttl or None,
+                keepttl=not self.ttl,
+                xx=True,
             )
+        else:
+            name = self._session_prefix + session_key.encode()
+            # WATCH keeps a concurrent delete from being undone by the HSET
+            with self._redis.pipeline() as pipe:
+                while True:
+                    try:
+                        pipe.watch(name)
+                        updated = pipe.hexists(name, session_id)
+                        if updated:
+                            pipe.multi()
+                            pipe.hset(
+                                name=name, key=session_id, value=dumps_data
+                            )
+                            if self.ttl:
+                                pipe.hexpire(name, self.ttl, session_id)
+                            pipe.execute()
+                        break
+                    except WatchError:
+                        continue
+        if not updated:
             if self._logger:
-                self._logger.debug(
-                    "TTL for session %s reset to %d seconds.",
-                    session_id,
-                    self.ttl,
+                self._logger.warning(
+                    f"Attempted to update non-existent session {session_id}"
                 )
+            raise JamSessionNotFound(details={"session_id": session_id})
+        if self._logger:
+            self._logger.debug(
+                "Session %s updated successfully in Redis", session_id
+            )
 
-    # TODO: Optimize this method
     def rework(self, session_id: str) -> str:
         """Rework a session and return its new ID.
 
+        The stored blob is moved to the new ID as is. In the `hash` layout
+        it is read under WATCH and the write, TTL and delete go out in one
+        MULTI/EXEC, retried if the hash changed in between, so concurrent
+        reworks of one ID leave a single live session; in the `string`
+        layout the key is renamed.
+
         Args:
             session_id (str): The ID of the session to rework.
 
@@ -257,14 +426,43 @@ class RedisSessions(BaseSessionModule):
         Returns:
             str: The new session ID.
         """
-        decoded_session_key = self.__decode_session_id_if_needed__(
-            session_id
-        ).split(":", 1)
-        session_data = self.get(session_id)
-        if not session_data:
-            raise JamSessionNotFound(details={"session_id": session_id})
-
-        new_session_id = self.create(decoded_session_key[0], session_data)
-
-        self.delete(session_id)
+        session_key = self._session_key(session_id)
+        new_session_id = self.__encode_session_id_if_needed__(
+            f"{session_key}:{self.id}"
+        )
+        if self._layout == "string":
+            # RENAME keeps the stored blob and fails if the session is gone
+            new_name = self._string_name(session_key, new_session_id)
+            pipe = self._redis.pipeline()
+            pipe.rename(self._string_name(session_key, session_id), new_name)
+            if self.ttl:
+                pipe.expire(new_name, self.ttl)
+            try:
+                pipe.execute()
+            except ResponseError:
+                raise JamSessionNotFound(details={"session_id": session_id})
+        else:
+            name = self._session_prefix + session_key.encode()
+            with self._redis.pipeline() as pipe:
+                while True:
+                    try:
+                        pipe.watch(name)
+                        session = pipe.hget(name, session_id)
+                        if not session:
+                            raise JamSessionNotFound(
+                                details={"session_id": session_id}
+                            )
+                        pipe.multi()
+                        pipe.hset(name, new_session_id, session)
+                        if self.ttl:
+                            pipe.hexpire(name, self.ttl, new_session_id)
+                        pipe.hdel(name, session_id)
+                        pipe.execute()
+                        break
+                    except WatchError:
+                        continue
+        if self._logger:
+            self._logger.debug(
+                "Session %s reworked to %s.", session_id, new_session_id
+            )
         return new_session_id
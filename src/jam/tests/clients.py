@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 
-import datetime
+from functools import lru_cache
 import json
+import time
 from typing import Any, Union
 import uuid
 
@@ -20,6 +21,179 @@ from jam.tests.fakers import (
 )
 
 
+@lru_cache(maxsize=64)
+def _fake_authorized_url(provider: str) -> str:
+    """Build the fake authorization URL, cached per provider."""
+    return (
+        f"https://{provider}/auth&client_id=TEST_CLIENT"
+        "&redirect_uri=https%3A%2F%2Fexample.com&response_type=code"
+    )
+
+
+def _fake_oauth2_response() -> dict[str, Any]:
+    """Build the token response returned by the fake OAuth2 methods."""
+    return {
+        "access_token": fake_oauth2_token(),
+        "access_expire": 9999999,
+        "refresh_token": fake_oauth2_token(),
+        "refresh_expire": 999999,
+        "token_type": "bearer",
+    }
+
+
+def _fake_jwt_decode(
+    token: str, check_exp: bool, check_nbf: bool, include_headers: bool
+) -> dict[str, Any]:
+    """Decode a fake JWT for `jwt_decode`.
+
+    Raises:
+        ValueError: If the token format is invalid.
+    """
+    if token.count(".") != 2:
+        raise ValueError("Invalid token format.")
+    try:
+        headers_b64, payload_b64, _ = token.split(".", 2)
+        headers = json.loads(base64url_decode(headers_b64))
+        payload = json.loads(base64url_decode(payload_b64))
+
+        if headers.get("typ") == "fake-JWT":
+            if check_exp and "exp" in payload:
+                if payload["exp"] < time.time():
+                    from jam.exceptions import JamJWTExpired
+
+                    raise JamJWTExpired
+
+            if check_nbf and "nbf" in payload:
+                if payload["nbf"] > time.time():
+                    from jam.exceptions import JamJWTNotYetValid
+
+                    raise JamJWTNotYetValid
+
+            if include_headers:
+                return {"header": headers, "payload": payload}
+            return payload
+        else:
+            raise ValueError("Invalid token format.")
+    except (ValueError, IndexError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid token format.") from e
+
+
+def _fake_jws_verify(token: str) -> dict[str, Any]:
+    """Decode a fake JWS for `jws_verify`.
+
+    Raises:
+        ValueError: If the token format is invalid.
+    """
+    try:
+        parts = token.split(".")
+        if len(parts) != 3:
+            raise ValueError("Invalid JWS token format")
+        payload_b64 = parts[1]
+        payload_str = base64url_decode(payload_b64).decode("utf-8")
+        try:
+            return json.loads(payload_str)
+        except json.JSONDecodeError:
+            return {"data": payload_str}
+    except (ValueError, IndexError) as e:
+        raise ValueError("Invalid JWS token format.") from e
+
+
+def _fake_jwe_decrypt(token: str) -> bytes:
+    """Decode a fake JWE for `jwe_decrypt`.
+
+    Raises:
+        ValueError: If the token format is invalid.
+    """
+    try:
+        parts = token.split(".")
+        if len(parts) != 4:
+            raise ValueError("Invalid JWE token format")
+        payload_b64 = parts[1]
+        return base64url_decode(payload_b64)
+    except (ValueError, IndexError) as e:
+        raise ValueError("Invalid JWE token format.") from e
+
+
+def _fake_otp_uri(
+    secret: str, name: str, issuer: str, counter: int | None
+) -> str:
+    """Build the otpauth:// URI for `otp_uri`."""
+    uri = f"otpauth://totp/{name}?secret={secret}"
+    if issuer:
+        uri += f"&issuer={issuer}"
+    if counter is not None:
+        uri += f"&counter={counter}"
+    return uri
+
+
+def _bulk_delete_by_key(
+    sessions: dict[str, tuple[str, dict[str, Any]]], session_ids: set[str]
+) -> dict[str, tuple[str, dict[str, Any]]]:
+    """Drop `session_ids` from the fake session store.
+
+    When most of the store goes, one rebuild is cheaper than popping
+    entry by entry.
+
+    Args:
+        sessions (dict): Session store, session_id -> (session_key, data)
+        session_ids (set[str]): IDs to delete
+
+    Returns:
+        dict: Store without the deleted sessions
+    """
+    if len(session_ids) > len(sessions) // 2:
+        return {
+            sid: record
+            for sid, record in sessions.items()
+            if sid not in session_ids
+        }
+    for session_id in session_ids:
+        sessions.pop(session_id, None)
+    return sessions
+
+
+_PASETO_VERSIONS = frozenset(("v1", "v2", "v3", "v4", "v_fake"))
+
+
+def _fake_paseto_decode(token: str) -> dict[str, Any]:
+    """Decode a fake PASETO for `paseto_decode`.
+
+    Raises:
+        ValueError: If the token format is invalid.
+    """
+    if not token.startswith("v"):
+        raise ValueError("Invalid PASETO token format.")
+    try:
+        parts = token.split(".", 3)
+        if len(parts) < 3:
+            raise ValueError("Invalid PASETO token format")
+
+        if parts[0] not in _PASETO_VERSIONS:
+            raise ValueError("Invalid PASETO version")
+
+        payload_part = parts[2]
+        footer_part = parts[3] if len(parts) > 3 else None
+
+        payload = json.loads(base64url_decode(payload_part))
+
+        footer = None
+        if footer_part:
+            footer_raw = base64url_decode(footer_part)
+            try:
+                footer = json.loads(footer_raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                footer = footer_raw.decode("utf-8")
+
+        return {"payload": payload, "footer": footer}
+    except (
+        ValueError,
+        IndexError,
+        json.JSONDecodeError,
+        UnicodeDecodeError,
+    ) as e:
+        raise ValueError("Invalid PASETO token format.") from e
+
+
 class TestJam(Jam):
     """A test client for Jam.
 
@@ -53,6 +227,9 @@ class TestJam(Jam):
     """
 
     __test__ = False
+    # Jam keeps a __dict__ for its modules, but the session stores are
+    # fixed and hit on every call, so they live in slots
+    __slots__ = ("_sessions", "_keys_to_ids")
 
     def __init__(
         self,
@@ -67,8 +244,10 @@ class TestJam(Jam):
         """
         super().__init__(config=config or {}, pointer=pointer)
         self.module = self
-        self._sessions: dict[str, dict[str, Any]] = {}
-        self._session_keys: dict[str, str] = {}
+        # session_id -> (session_key, data), plus session_key -> IDs so
+        # session_clear does not scan every session
+        self._sessions: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._keys_to_ids: dict[str, set[str]] = {}
 
     @deprecated(
         "This method is deprecated; the JWT payload is generated automatically in accordance with the specification."
@@ -85,13 +264,13 @@ class TestJam(Jam):
         Returns:
             dict[str, Any]: Payload
         """
-        payload = {
-            "iat": datetime.datetime.now().timestamp(),
-            "exp": (datetime.datetime.now().timestamp() + exp) if exp else None,
+        now = time.time()
+        return {
+            "iat": now,
+            "exp": now + exp if exp else None,
             "jti": str(uuid.uuid4()),
+            **data,
         }
-        payload = payload | data
-        return payload
 
     @deprecated("Use jam.jwt_encode")
     def jwt_create(self, payload: dict[str, Any]) -> str:
@@ -166,31 +345,7 @@ class TestJam(Jam):
         Raises:
             ValueError: If the token format is invalid.
         """
-        try:
-            headers_b64, payload_b64, _ = token.split(".")
-            headers = json.loads(base64url_decode(headers_b64).decode("utf-8"))
-            payload = json.loads(base64url_decode(payload_b64).decode("utf-8"))
-
-            if headers.get("typ") == "fake-JWT":
-                if check_exp and "exp" in payload:
-                    if payload["exp"] < datetime.datetime.now().timestamp():
-                        from jam.exceptions import JamJWTExpired
-
-                        raise JamJWTExpired
-
-                if check_nbf and "nbf" in payload:
-                    if payload["nbf"] > datetime.datetime.now().timestamp():
-                        from jam.exceptions import JamJWTNotYetValid
-
-                        raise JamJWTNotYetValid
-
-                if include_headers:
-                    return {"header": headers, "payload": payload}
-                return payload
-            else:
-                raise ValueError("Invalid token format.")
-        except (ValueError, IndexError, json.JSONDecodeError) as e:
-            raise ValueError("Invalid token format.") from e
+        return _fake_jwt_decode(token, check_exp, check_nbf, include_headers)
 
     def jws_sign(
         self,
@@ -217,18 +372,7 @@ class TestJam(Jam):
         Returns:
             dict[str, Any]: Decoded payload.
         """
-        try:
-            parts = token.split(".")
-            if len(parts) != 3:
-                raise ValueError("Invalid JWS token format")
-            payload_b64 = parts[1]
-            payload_str = base64url_decode(payload_b64).decode("utf-8")
-            try:
-                return json.loads(payload_str)
-            except json.JSONDecodeError:
-                return {"data": payload_str}
-        except (ValueError, IndexError) as e:
-            raise ValueError("Invalid JWS token format.") from e
+        return _fake_jws_verify(token)
 
     def jwe_encrypt(
         self,
@@ -255,14 +399,7 @@ class TestJam(Jam):
         Returns:
             bytes: Decrypted data.
         """
-        try:
-            parts = token.split(".")
-            if len(parts) != 4:
-                raise ValueError("Invalid JWE token format")
-            payload_b64 = parts[1]
-            return base64url_decode(payload_b64)
-        except (ValueError, IndexError) as e:
-            raise ValueError("Invalid JWE token format.") from e
+        return _fake_jwe_decrypt(token)
 
     def session_create(self, session_key: str, data: dict[str, Any]) -> str:
         """Create new session.
@@ -275,8 +412,10 @@ class TestJam(Jam):
             str: New session ID
         """
         session_id = generate_session_id()
-        self._sessions[session_id] = data.copy()
-        self._session_keys[session_id] = session_key
+        # Copy so later changes to the caller's dict do not leak into the
+        # stored session, as they would not with a real backend
+        self._sessions[session_id] = (session_key, data.copy())
+        self._keys_to_ids.setdefault(session_key, set()).add(session_id)
         return session_id
 
     def session_get(self, session_id: str) -> dict[str, Any] | None:
@@ -288,7 +427,8 @@ class TestJam(Jam):
         Returns:
             dict[str, Any] | None: Session data if exist
         """
-        return self._sessions.get(session_id)
+        record = self._sessions.get(session_id)
+        return record[1] if record else None
 
     def session_delete(self, session_id: str) -> None:
         """Delete session.
@@ -296,8 +436,9 @@ class TestJam(Jam):
         Args:
             session_id (str): Session ID
         """
-        self._sessions.pop(session_id, None)
-        self._session_keys.pop(session_id, None)
+        record = self._sessions.pop(session_id, None)
+        if record:
+            self._keys_to_ids.get(record[0], set()).discard(session_id)
 
     def session_update(self, session_id: str, data: dict[str, Any]) -> None:
         """Update session data.
@@ -306,8 +447,9 @@ class TestJam(Jam):
             session_id (str): Session ID
             data (dict[str, Any]): New data
         """
-        if session_id in self._sessions:
-            self._sessions[session_id].update(data)
+        record = self._sessions.get(session_id)
+        if record:
+            record[1].update(data)
 
     def session_clear(self, session_key: str) -> None:
         """Delete all sessions by key.
@@ -315,14 +457,9 @@ class TestJam(Jam):
         Args:
             session_key (str): Key of session
         """
-        to_delete = [
-            session_id
-            for session_id, key in self._session_keys.items()
-            if key == session_key
-        ]
-        for session_id in to_delete:
-            self._sessions.pop(session_id, None)
-            self._session_keys.pop(session_id, None)
+        self._sessions = _bulk_delete_by_key(
+            self._sessions, self._keys_to_ids.pop(session_key, set())
+        )
 
     def session_rework(self, old_session_id: str) -> str:
         """Rework session.
@@ -333,17 +470,17 @@ class TestJam(Jam):
         Returns:
             str: New session id
         """
-        if old_session_id not in self._sessions:
+        record = self._sessions.get(old_session_id)
+        if not record:
             session_id = generate_session_id()
-            self._sessions[session_id] = {}
+            self._sessions[session_id] = ("default", {})
             return session_id
 
-        old_data = self._sessions[old_session_id].copy()
-        old_key = self._session_keys.get(old_session_id, "default")
+        old_key, old_data = record
         new_session_id = generate_session_id()
 
-        self._sessions[new_session_id] = old_data
-        self._session_keys[new_session_id] = old_key
+        self._sessions[new_session_id] = (old_key, old_data.copy())
+        self._keys_to_ids.setdefault(old_key, set()).add(new_session_id)
 
         return new_session_id
 
@@ -377,12 +514,7 @@ class TestJam(Jam):
         Returns:
             str: A string of the form "otpauth://..."
         """
-        uri = f"otpauth://totp/{name}?secret={secret}"
-        if issuer:
-            uri += f"&issuer={issuer}"
-        if counter is not None:
-            uri += f"&counter={counter}"
-        return uri
+        return _fake_otp_uri(secret, name, issuer, counter)
 
     def otp_verify_code(
         self,
@@ -417,7 +549,7 @@ class TestJam(Jam):
         Returns:
             str: Authorization url
         """
-        return f"https://{provider}/auth&client_id=TEST_CLIENT&redirect_uri=https%3A%2F%2Fexample.com&response_type=code"
+        return _fake_authorized_url(provider)
 
     def oauth2_fetch_token(
         self,
@@ -437,13 +569,7 @@ class TestJam(Jam):
         Returns:
             dict: OAuth2 token
         """
-        return {
-            "access_token": fake_oauth2_token(),
-            "access_expire": 9999999,
-            "refresh_token": fake_oauth2_token(),
-            "refresh_expire": 999999,
-            "token_type": "bearer",
-        }
+        return _fake_oauth2_response()
 
     def oauth2_refresh_token(
         self,
@@ -463,13 +589,7 @@ class TestJam(Jam):
         Returns:
             dict: Refresh token
         """
-        return {
-            "access_token": fake_oauth2_token(),
-            "access_expire": 9999999,
-            "refresh_token": fake_oauth2_token(),
-            "refresh_expire": 999999,
-            "token_type": "bearer",
-        }
+        return _fake_oauth2_response()
 
     def oauth2_client_credentials_flow(
         self,
@@ -487,13 +607,7 @@ class TestJam(Jam):
         Returns:
             dict: JSON with access token
         """
-        return {
-            "access_token": fake_oauth2_token(),
-            "access_expire": 9999999,
-            "refresh_token": fake_oauth2_token(),
-            "refresh_expire": 999999,
-            "token_type": "bearer",
-        }
+        return _fake_oauth2_response()
 
     def paseto_make_payload(
         self, exp: int | None = None, **data: dict[str, Any]
@@ -540,36 +654,7 @@ class TestJam(Jam):
         Returns:
             dict: {'payload' PAYLOAD, 'footer': FOOTER}
         """
-        try:
-            parts = token.split(".")
-            if len(parts) < 3:
-                raise ValueError("Invalid PASETO token format")
-
-            if parts[0] not in ("v1", "v2", "v3", "v4", "v_fake"):
-                raise ValueError("Invalid PASETO version")
-
-            payload_part = parts[2]
-            footer_part = parts[3] if len(parts) > 3 else None
-
-            payload = json.loads(base64url_decode(payload_part).decode("utf-8"))
-
-            footer = None
-            if footer_part:
-                try:
-                    footer = json.loads(
-                        base64url_decode(footer_part).decode("utf-8")
-                    )
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    footer = base64url_decode(footer_part).decode("utf-8")
-
-            return {"payload": payload, "footer": footer}
-        except (
-            ValueError,
-            IndexError,
-            json.JSONDecodeError,
-            UnicodeDecodeError,
-        ) as e:
-            raise ValueError("Invalid PASETO token format.") from e
+        return _fake_paseto_decode(token)
 
 
 class TestAsyncJam(AioJam):
@@ -602,6 +687,9 @@ class TestAsyncJam(AioJam):
     """
 
     __test__ = False
+    # Jam keeps a __dict__ for its modules, but the session stores are
+    # fixed and hit on every call, so they live in slots
+    __slots__ = ("_sessions", "_keys_to_ids")
 
     def __init__(
         self,
@@ -616,8 +704,10 @@ class TestAsyncJam(AioJam):
         """
         super().__init__(config=config or {}, pointer=pointer)
         self.module = self
-        self._sessions: dict[str, dict[str, Any]] = {}
-        self._session_keys: dict[str, str] = {}
+        # session_id -> (session_key, data), plus session_key -> IDs so
+        # session_clear does not scan every session
+        self._sessions: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._keys_to_ids: dict[str, set[str]] = {}
 
     @deprecated(
         "This method is deprecated; the JWT payload is generated automatically in accordance with the specification."
@@ -634,13 +724,13 @@ class TestAsyncJam(AioJam):
         Returns:
             dict[str, Any]: Payload
         """
-        payload = {
-            "iat": datetime.datetime.now().timestamp(),
-            "exp": (datetime.datetime.now().timestamp() + exp) if exp else None,
+        now = time.time()
+        return {
+            "iat": now,
+            "exp": now + exp if exp else None,
             "jti": str(uuid.uuid4()),
+            **data,
         }
-        payload = payload | data
-        return payload
 
     @deprecated("Use jam.jwt_encode")
     async def jwt_create(self, payload: dict[str, Any]) -> str:
@@ -715,31 +805,7 @@ class TestAsyncJam(AioJam):
         Raises:
             ValueError: If the token format is invalid.
         """
-        try:
-            headers_b64, payload_b64, _ = token.split(".")
-            headers = json.loads(base64url_decode(headers_b64).decode("utf-8"))
-            payload = json.loads(base64url_decode(payload_b64).decode("utf-8"))
-
-            if headers.get("typ") == "fake-JWT":
-                if check_exp and "exp" in payload:
-                    if payload["exp"] < datetime.datetime.now().timestamp():
-                        from jam.exceptions import JamJWTExpired
-
-                        raise JamJWTExpired
-
-                if check_nbf and "nbf" in payload:
-                    if payload["nbf"] > datetime.datetime.now().timestamp():
-                        from jam.exceptions import JamJWTNotYetValid
-
-                        raise JamJWTNotYetValid
-
-                if include_headers:
-                    return {"header": headers, "payload": payload}
-                return payload
-            else:
-                raise ValueError("Invalid token format.")
-        except (ValueError, IndexError, json.JSONDecodeError) as e:
-            raise ValueError("Invalid token format.") from e
+        return _fake_jwt_decode(token, check_exp, check_nbf, include_headers)
 
     async def jws_sign(
         self,
@@ -766,18 +832,7 @@ class TestAsyncJam(AioJam):
         Returns:
             dict[str, Any]: Decoded payload.
         """
-        try:
-            parts = token.split(".")
-            if len(parts) != 3:
-                raise ValueError("Invalid JWS token format")
-            payload_b64 = parts[1]
-            payload_str = base64url_decode(payload_b64).decode("utf-8")
-            try:
-                return json.loads(payload_str)
-            except json.JSONDecodeError:
-                return {"data": payload_str}
-        except (ValueError, IndexError) as e:
-            raise ValueError("Invalid JWS token format.") from e
+        return _fake_jws_verify(token)
 
     async def jwe_encrypt(
         self,
@@ -804,14 +859,7 @@ class TestAsyncJam(AioJam):
         Returns:
             bytes: Decrypted data.
         """
-        try:
-            parts = token.split(".")
-            if len(parts) != 4:
-                raise ValueError("Invalid JWE token format")
-            payload_b64 = parts[1]
-            return base64url_decode(payload_b64)
-        except (ValueError, IndexError) as e:
-            raise ValueError("Invalid JWE token format.") from e
+        return _fake_jwe_decrypt(token)
 
     async def session_create(
         self, session_key: str, data: dict[str, Any]
@@ -826,8 +874,10 @@ class TestAsyncJam(AioJam):
             str: New session ID
         """
         session_id = generate_session_id()
-        self._sessions[session_id] = data.copy()
-        self._session_keys[session_id] = session_key
+        # Copy so later changes to the caller's dict do not leak into the
+        # stored session, as they would not with a real backend
+        self._sessions[session_id] = (session_key, data.copy())
+        self._keys_to_ids.setdefault(session_key, set()).add(session_id)
         return session_id
 
     async def session_get(self, session_id: str) -> dict[str, Any] | None:
@@ -839,7 +889,8 @@ class TestAsyncJam(AioJam):
         Returns:
             dict[str, Any] | None: Session data if exist
         """
-        return self._sessions.get(session_id)
+        record = self._sessions.get(session_id)
+        return record[1] if record else None
 
     async def session_delete(self, session_id: str) -> None:
         """Delete session.
@@ -847,8 +898,9 @@ class TestAsyncJam(AioJam):
         Args:
             session_id (str): Session ID
         """
-        self._sessions.pop(session_id, None)
-        self._session_keys.pop(session_id, None)
+        record = self._sessions.pop(session_id, None)
+        if record:
+            self._keys_to_ids.get(record[0], set()).discard(session_id)
 
     async def session_update(
         self, session_id: str, data: dict[str, Any]
@@ -859,8 +911,9 @@ class TestAsyncJam(AioJam):
             session_id (str): Session ID
             data (dict[str, Any]): New data
         """
-        if session_id in self._sessions:
-            self._sessions[session_id].update(data)
+        record = self._sessions.get(session_id)
+        if record:
+            record[1].update(data)
 
     async def session_clear(self, session_key: str) -> None:
         """Delete all sessions by key.
@@ -868,14 +921,9 @@ class TestAsyncJam(AioJam):
         Args:
             session_key (str): Key of session
         """
-        to_delete = [
-            session_id
-            for session_id, key in self._session_keys.items()
-            if key == session_key
-        ]
-        for session_id in to_delete:
-            self._sessions.pop(session_id, None)
-            self._session_keys.pop(session_id, None)
+        self._sessions = _bulk_delete_by_key(
+            self._sessions, self._keys_to_ids.pop(session_key, set())
+        )
 
     async def session_rework(self, old_session_id: str) -> str:
         """Rework session.
@@ -886,17 +934,17 @@ class TestAsyncJam(AioJam):
         Returns:
             str: New session id
         """
-        if old_session_id not in self._sessions:
+        record = self._sessions.get(old_session_id)
+        if not record:
             session_id = generate_session_id()
-            self._sessions[session_id] = {}
+            self._sessions[session_id] = ("default", {})
             return session_id
 
-        old_data = self._sessions[old_session_id].copy()
-        old_key = self._session_keys.get(old_session_id, "default")
+        old_key, old_data = record
         new_session_id = generate_session_id()
 
-        self._sessions[new_session_id] = old_data
-        self._session_keys[new_session_id] = old_key
+        self._sessions[new_session_id] = (old_key, old_data.copy())
+        self._keys_to_ids.setdefault(old_key, set()).add(new_session_id)
 
         return new_session_id
 
@@ -932,12 +980,7 @@ class TestAsyncJam(AioJam):
         Returns:
             str: A string of the form "otpauth://..."
         """
-        uri = f"otpauth://totp/{name}?secret={secret}"
-        if issuer:
-            uri += f"&issuer={issuer}"
-        if counter is not None:
-            uri += f"&counter={counter}"
-        return uri
+        return _fake_otp_uri(secret, name, issuer, counter)
 
     async def otp_verify_code(
         self,
@@ -972,7 +1015,7 @@ class TestAsyncJam(AioJam):
         Returns:
             str: Authorization url
         """
-        return f"https://{provider}/auth&client_id=TEST_CLIENT&redirect_uri=https%3A%2F%2Fexample.com&response_type=code"
+        return _fake_authorized_url(provider)
 
     async def oauth2_fetch_token(
         self,
@@ -992,13 +1035,7 @@ class TestAsyncJam(AioJam):
         Returns:
             dict: OAuth2 token
         """
-        return {
-            "access_token": fake_oauth2_token(),
-            "access_expire": 9999999,
-            "refresh_token": fake_oauth2_token(),
-            "refresh_expire": 999999,
-            "token_type": "bearer",
-        }
+        return _fake_oauth2_response()
 
     async def oauth2_refresh_token(
         self,
@@ -1018,13 +1055,7 @@ class TestAsyncJam(AioJam):
         Returns:
             dict: Refresh token
         """
-        return {
-            "access_token": fake_oauth2_token(),
-            "access_expire": 9999999,
-            "refresh_token": fake_oauth2_token(),
-            "refresh_expire": 999999,
-            "token_type": "bearer",
-        }
+        return _fake_oauth2_response()
 
     async def oauth2_client_credentials_flow(
         self,
@@ -1042,13 +1073,7 @@ class TestAsyncJam(AioJam):
         Returns:
             dict: JSON with access token
         """
-        return {
-            "access_token": fake_oauth2_token(),
-            "access_expire": 9999999,
-            "refresh_token": fake_oauth2_token(),
-            "refresh_expire": 999999,
-            "token_type": "bearer",
-        }
+        return _fake_oauth2_response()
 
     async def paseto_make_payload(
         self, exp: int | None = None, **data: dict[str, Any]
@@ -1095,33 +1120,4 @@ class TestAsyncJam(AioJam):
         Returns:
             dict: {'payload' PAYLOAD, 'footer': FOOTER}
         """
-        try:
-            parts = token.split(".")
-            if len(parts) < 3:
-                raise ValueError("Invalid PASETO token format")
-
-            if parts[0] not in ("v1", "v2", "v3", "v4", "v_fake"):
-                raise ValueError("Invalid PASETO version")
-
-            payload_part = parts[2]
-            footer_part = parts[3] if len(parts) > 3 else None
-
-            payload = json.loads(base64url_decode(payload_part).decode("utf-8"))
-
-            footer = None
-            if footer_part:
-                try:
-                    footer = json.loads(
-                        base64url_decode(footer_part).decode("utf-8")
-                    )
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    footer = base64url_decode(footer_part).decode("utf-8")
-
-            return {"payload": payload, "footer": footer}
-        except (
-            ValueError,
-            IndexError,
-            json.JSONDecodeError,
-            UnicodeDecodeError,
-        ) as e:
-            raise ValueError("Invalid PASETO token format.") from e
+        return _fake_paseto_decode(token)
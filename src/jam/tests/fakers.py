@@ -1,15 +1,42 @@
 # -*- coding: utf-8 -*-
 
 import json
-from secrets import token_urlsafe
+import os
+from secrets import token_hex, token_urlsafe
+import threading
 from typing import Any
-import uuid
 
 from jam.__deprecated__ import deprecated
 from jam.jose.utils import __base64url_encode__ as base64url_encode
 from jam.utils import xor_my_data
 
 
+def _dumps_compact(data: Any) -> bytes:
+    """Serialize to compact JSON bytes.
+
+    Always the stdlib, so fake tokens do not depend on whether orjson is
+    installed (it differs on NaN, datetimes and UUIDs).
+    """
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+# Headers of the fake tokens are constant unless overridden, so they are
+# serialized and encoded once here.
+_FAKE_JWT_HEADER_B64 = base64url_encode(
+    _dumps_compact({"typ": "fake-JWT", "alg": "none"})
+)
+_FAKE_JWT_V2_HEADER_B64 = base64url_encode(
+    _dumps_compact({"typ": "fake-JWT", "alg": "fake-alg"})
+)
+_FAKE_JWS_HEADER_B64 = base64url_encode(
+    _dumps_compact({"typ": "fake-JWS", "alg": "none"})
+)
+_FAKE_JWE_HEADER_B64 = base64url_encode(
+    _dumps_compact({"typ": "fake-JWE", "alg": "fake-alg", "enc": "fake-enc"})
+)
+_FAKE_PASETO_PREFIX = "v_fake.local."
+
+
 @deprecated("Use fake_jwt_token_v2")
 def fake_jwt_token(payload: dict[str, Any] | None) -> str:
     """Generate a fake JWT token for testing purposes.
@@ -20,18 +47,8 @@ def fake_jwt_token(payload: dict[str, Any] | None) -> str:
     Returns:
         str: A fake JWT token.
     """
-    header = {"typ": "fake-JWT", "alg": "none"}
-    payload_data = payload or {}
-
-    header_b64 = base64url_encode(
-        json.dumps(header, separators=(",", ": ")).encode("utf-8")
-    )
-    payload_b64 = base64url_encode(
-        json.dumps(payload_data, separators=(",", ": ")).encode("utf-8")
-    )
-    signature = "fake_signature"
-
-    return f"{header_b64}.{payload_b64}.{signature}"
+    payload_b64 = base64url_encode(_dumps_compact(payload or {}))
+    return f"{_FAKE_JWT_HEADER_B64}.{payload_b64}.fake_signature"
 
 
 def fake_jwt_token_v2(
@@ -45,8 +62,6 @@ def fake_jwt_token_v2(
     header: dict[str, Any] | None = None,
 ) -> str:
     """Generate a fake JWT token for testing purposes."""
-    _header = {"typ": "fake-JWT", "alg": "fake-alg"}
-    _header.update(header or {})
     payload = {
         "iss": iss,
         "sub": sub,
@@ -58,8 +73,13 @@ def fake_jwt_token_v2(
     }
     payload = {k: v for k, v in payload.items() if v is not None}
 
-    header_64 = base64url_encode(json.dumps(_header).encode("utf-8"))
-    payload_64 = base64url_encode(json.dumps(payload).encode("utf-8"))
+    if header:
+        header_64 = base64url_encode(
+            _dumps_compact({"typ": "fake-JWT", "alg": "fake-alg", **header})
+        )
+    else:
+        header_64 = _FAKE_JWT_V2_HEADER_B64
+    payload_64 = base64url_encode(_dumps_compact(payload))
 
     return f"{header_64}.{payload_64}.fake_signature"
 
@@ -73,18 +93,64 @@ def invalid_token() -> str:
     return f"INVALID_{token_urlsafe(16)}_TOKEN"
 
 
+def _xor_template(prefix: str, key: str) -> tuple[str, str]:
+    """Pre-XOR a constant token prefix.
+
+    Args:
+        prefix (str): ASCII prefix of the token
+        key (str): XOR key
+
+    Returns:
+        tuple[str, str]: XORed prefix in hex and the key rotated to where
+            the prefix stops, for XORing the random suffix on its own
+    """
+    offset = len(prefix) % len(key)
+    return xor_my_data(prefix, key), key[offset:] + key[:offset]
+
+
+_OAUTH2_FAKE_KEY = "JAM_FAKE"
+_VALID_OAUTH2_PREFIX, _VALID_OAUTH2_KEY = _xor_template(
+    "VALID_OAUTH2_TOKEN:", _OAUTH2_FAKE_KEY
+)
+_INVALID_OAUTH2_PREFIX, _INVALID_OAUTH2_KEY = _xor_template(
+    "INVALID_OAUTH2_TOKEN:", _OAUTH2_FAKE_KEY
+)
+
+
+_ENTROPY_SIZE = 4096
+_entropy = b""
+_entropy_pos = 0
+_entropy_lock = threading.Lock()
+
+
+def _oauth2_suffix() -> str:
+    """Random suffix for fake OAuth2 tokens, like `token_urlsafe(4)`.
+
+    Slices a local entropy buffer instead of reading the OS RNG on every
+    call, which adds up in suites that mint many fake tokens.
+    """
+    global _entropy, _entropy_pos
+    with _entropy_lock:
+        pos = _entropy_pos
+        if pos + 4 > len(_entropy):
+            _entropy = os.urandom(_ENTROPY_SIZE)
+            pos = 0
+        _entropy_pos = pos + 4
+        return base64url_encode(_entropy[pos : pos + 4])
+
+
 def fake_oauth2_token() -> str:
     """Return VALID fake oauth2 token."""
-    k = "JAM_FAKE"
-    token = f"VALID_OAUTH2_TOKEN:{token_urlsafe(4)}"
-    return xor_my_data(token, k)
+    return _VALID_OAUTH2_PREFIX + xor_my_data(
+        _oauth2_suffix(), _VALID_OAUTH2_KEY
+    )
 
 
 def invalid_oauth2_token() -> str:
     """Invalid OAuth2 token."""
-    k = "JAM_FAKE"
-    token = f"INVALID_OAUTH2_TOKEN:{token_urlsafe(4)}"
-    return xor_my_data(token, k)
+    return _INVALID_OAUTH2_PREFIX + xor_my_data(
+        _oauth2_suffix(), _INVALID_OAUTH2_KEY
+    )
 
 
 def generate_session_id() -> str:
@@ -93,7 +159,7 @@ def generate_session_id() -> str:
     Returns:
         str: A unique session ID.
     """
-    return f"fake-session-{uuid.uuid4().hex}"
+    return f"fake-session-{token_hex(16)}"
 
 
 def fake_paseto_token(
@@ -111,26 +177,19 @@ def fake_paseto_token(
     Returns:
         str: A fake PASETO token.
     """
-    version = "v_fake"
-    purpose = "local"
-    payload_data = payload or {}
-
-    payload_json = json.dumps(payload_data, separators=(",", ": "))
-    payload_b64 = base64url_encode(payload_json.encode("utf-8"))
-
-    token = f"{version}.{purpose}.{payload_b64}"
-
-    if footer:
-        if isinstance(footer, dict):
-            footer_json = json.dumps(footer, separators=(",", ": "))
-            footer_b64 = base64url_encode(footer_json.encode("utf-8"))
-        elif isinstance(footer, bytes):
-            footer_b64 = base64url_encode(footer)
-        else:
-            footer_b64 = base64url_encode(str(footer).encode("utf-8"))
-        token += f".{footer_b64}"
-
-    return token
+    payload_b64 = base64url_encode(_dumps_compact(payload or {}))
+    if not footer:
+        return _FAKE_PASETO_PREFIX + payload_b64
+
+    if isinstance(footer, dict):
+        footer_bytes = _dumps_compact(footer)
+    elif isinstance(footer, bytes):
+        footer_bytes = footer
+    else:
+        footer_bytes = str(footer).encode("utf-8")
+    return "".join(
+        (_FAKE_PASETO_PREFIX, payload_b64, ".", base64url_encode(footer_bytes))
+    )
 
 
 def fake_jws_token(
@@ -146,16 +205,18 @@ def fake_jws_token(
     Returns:
         str: A fake JWS token.
     """
-    _header = {"typ": "fake-JWS", "alg": "none"}
-    _header.update(header or {})
-
     if isinstance(data, dict):
-        payload = json.dumps(data)
+        payload = _dumps_compact(data)
     else:
-        payload = data or "fake_data"
+        payload = (data or "fake_data").encode("utf-8")
 
-    header_b64 = base64url_encode(json.dumps(_header).encode("utf-8"))
-    payload_b64 = base64url_encode(payload.encode("utf-8"))
+    if header:
+        header_b64 = base64url_encode(
+            _dumps_compact({"typ": "fake-JWS", "alg": "none", **header})
+        )
+    else:
+        header_b64 = _FAKE_JWS_HEADER_B64
+    payload_b64 = base64url_encode(payload)
 
     return f"{header_b64}.{payload_b64}.fake_signature"
 
@@ -173,15 +234,24 @@ def fake_jwe_token(
     Returns:
         str: A fake JWE token.
     """
-    _header = {"typ": "fake-JWE", "alg": "fake-alg", "enc": "fake-enc"}
-    _header.update(header or {})
-
     if isinstance(data, dict):
-        payload = json.dumps(data)
+        payload = _dumps_compact(data)
     else:
-        payload = data or "fake_encrypted_data"
-
-    header_b64 = base64url_encode(json.dumps(_header).encode("utf-8"))
-    payload_b64 = base64url_encode(payload.encode("utf-8"))
+        payload = (data or "fake_encrypted_data").encode("utf-8")
+
+    if header:
+        header_b64 = base64url_encode(
+            _dumps_compact(
+                {
+                    "typ": "fake-JWE",
+                    "alg": "fake-alg",
+                    "enc": "fake-enc",
+                    **header,
+                }
+            )
+        )
+    else:
+        header_b64 = _FAKE_JWE_HEADER_B64
+    payload_b64 = base64url_encode(payload)
 
     return f"{header_b64}.{payload_b64}.fake_encrypted.fake_signature"
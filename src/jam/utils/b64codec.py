@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+"""Base64 codec shared by the JOSE, PASETO and basic auth helpers.
+
+Binds pybase64 (SIMD, same API, shipped with the `speedups` extra) when it
+is installed, and the stdlib otherwise.
+"""
+
+try:
+    from pybase64 import (
+        b64decode,
+        b64encode,
+        urlsafe_b64decode,
+        urlsafe_b64encode,
+    )
+except ImportError:
+    from base64 import b64decode, b64encode
+    from binascii import a2b_base64, b2a_base64
+
+    _TO_URLSAFE = bytes.maketrans(b"+/", b"-_")
+    _FROM_URLSAFE = bytes.maketrans(b"-_", b"+/")
+
+    def urlsafe_b64encode(s: bytes) -> bytes:
+        """Same as base64.urlsafe_b64encode, without the stdlib wrappers."""
+        return b2a_base64(s, newline=False).translate(_TO_URLSAFE)
+
+    def urlsafe_b64decode(s: str | bytes) -> bytes:
+        """Same as base64.urlsafe_b64decode, without the stdlib wrappers."""
+        if isinstance(s, str):
+            s = s.encode("ascii")
+        return a2b_base64(s.translate(_FROM_URLSAFE))
+
+
+__all__ = ["b64decode", "b64encode", "urlsafe_b64decode", "urlsafe_b64encode"]
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-import base64
+from jam.utils.b64codec import b64decode, b64encode
 
 
 def basic_auth_encode(login: str, password: str) -> str:
@@ -17,8 +17,8 @@ def basic_auth_encode(login: str, password: str) -> str:
         YWRtaW46cXdlcnR5MTIzNA==
         ```
     """
-    credentials = f"{login}:{password}"
-    return base64.b64encode(credentials.encode()).decode()
+    credentials = b":".join((login.encode(), password.encode()))
+    return b64encode(credentials).decode("ascii")
 
 
 def basic_auth_decode(data: str) -> tuple[str, str]:
@@ -28,14 +28,14 @@ def basic_auth_decode(data: str) -> tuple[str, str]:
         data (str): Decoded data
 
     Raises:
-        ValueError: If incorrect format
+        ValueError: If incorrect format or not valid base64
 
     Example:
         >>> login, password = basic_auth_decode(header)
         >>> print(login, password)
         admin qwerty1234
     """
-    decoded_bytes = base64.b64decode(data)
+    decoded_bytes = b64decode(data, validate=True)
     decoded_str = decoded_bytes.decode()
 
     if ":" not in decoded_str:
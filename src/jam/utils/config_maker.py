@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from collections.abc import Callable
+from functools import lru_cache
 from importlib import import_module
 import os
 import re
@@ -14,88 +15,147 @@ from jam.exceptions import JamConfigurationError
 
 GENERIC_POINTER = "jam"
 
+# ${VAR:-default}, ${VAR} or $VAR
+_ENV_PATTERN = re.compile(
+    r"\$\{([^}^{]+?)(:-([^}]+))?\}|\$([A-Za-z_][A-Za-z0-9_]*)"
+)
 
-def __yaml_config_parser(
-    path: str, pointer: str = GENERIC_POINTER
-) -> dict[str, Any]:
-    """Private method for parsing YML config with env substitution.
 
-    Supports:
-    - ${VAR} - environment variable (required)
-    - ${VAR:-default} - environment variable with default value
-    - $VAR - short form (required)
+def _replace_env(match: re.Match) -> str:
+    """Resolve one `_ENV_PATTERN` match from the environment.
 
     Args:
-        path (str): Path to config.yml
-        pointer (str): Pointer to config section to read.
+        match (re.Match): Match of `_ENV_PATTERN`
 
     Raises:
-        JamConfigurationError: If pyyaml not installed, file not found, or invalid YAML
+        JamConfigurationError: If the variable is not set and has no default
 
     Returns:
-        dict[str, Any]: Parsed YAML section with environment variable substitution.
+        str: Variable value or its default
     """
-    try:
-        import yaml
-    except ImportError:
-        raise JamConfigurationError(
-            message="To generate a configuration file from YAML/YML, you need to install PyYaml: "
-            "`pip install pyyaml` or `pip install jamlib[yaml]`",
-            error_code="configuration.import_error",
+    braced, _, default, bare = match.groups()
+    var_name = braced or bare
+    env_value = os.getenv(var_name)
+    if env_value is not None:
+        return env_value
+    if default is not None:
+        return default
+    if braced:
+        message = (
+            f"Environment variable '{var_name}' not set and no default provided"
         )
-
-    # Pattern to match ${VAR:-default} or ${VAR} or $VAR
-    pattern = re.compile(
-        r"\$\{([^}^{]+?)(:-([^}]+))?\}|\$([A-Za-z_][A-Za-z0-9_]*)"
+    else:
+        message = f"Environment variable '{var_name}' not set"
+    raise JamConfigurationError(
+        message=message,
+        error_code="configuration.env_var_not_set",
     )
 
-    def replace_env(match):
-        if match.group(1):
-            var_name = match.group(1)
-            default_value = (
-                match.group(3) if match.group(3) is not None else None
-            )
-            env_value = os.getenv(var_name)
 
-            if env_value is None:
-                if default_value is not None:
-                    return default_value
-                raise JamConfigurationError(
-                    message=f"Environment variable '{var_name}' not set and no default provided",
-                    error_code="configuration.env_var_not_set",
-                )
-            return env_value
-        elif match.group(4):
-            var_name = match.group(4)
-            env_value = os.getenv(var_name)
-            if env_value is None:
-                raise JamConfigurationError(
-                    message=f"Environment variable '{var_name}' not set",
-                    error_code="configuration.env_var_not_set",
-                )
-            return env_value
-        return match.group(0)
+def _substitute_env(value: str) -> str:
+    """Substitute environment variables in a string.
 
-    class EnvVarLoader(yaml.SafeLoader):
-        pass
+    Args:
+        value (str): Raw string
 
-    def construct_scalar_with_env(loader, node):
-        value = loader.construct_scalar(node)
-        # Only process strings that contain variable patterns
-        if isinstance(value, str) and pattern.search(value):
-            return pattern.sub(replace_env, value)
+    Returns:
+        str: String with variables replaced
+    """
+    # Most values have no variables at all, skip the regex engine for them
+    if "$" not in value:
         return value
+    return _ENV_PATTERN.sub(_replace_env, value)
 
-    EnvVarLoader.add_constructor(
-        "tag:yaml.org,2002:str", construct_scalar_with_env
-    )
+
+def _substitute_env_tree(value: Any) -> Any:
+    """Recursively substitute environment variables in parsed config.
+
+    Args:
+        value (Any): Parsed config node
+
+    Returns:
+        Any: Node with variables replaced in every string
+    """
+    if isinstance(value, str):
+        return _substitute_env(value)
+    elif isinstance(value, dict):
+        return {
+            _substitute_env(k) if isinstance(k, str) else k: (
+                _substitute_env_tree(v)
+            )
+            for k, v in value.items()
+        }
+    elif isinstance(value, list):
+        return [_substitute_env_tree(v) for v in value]
+    return value
+
+
+def _copy_tree(value: Any) -> Any:
+    """Copy the containers of a parsed config without touching strings.
+
+    Used instead of `_substitute_env_tree` when the file has no `$` at
+    all, so cached trees are still never handed out.
+
+    Args:
+        value (Any): Parsed config node
+
+    Returns:
+        Any: Copied node
+    """
+    if isinstance(value, dict):
+        return {k: _copy_tree(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_copy_tree(v) for v in value]
+    return value
+
+
+def _file_signature(path: str, kind: str) -> tuple[str, int, int]:
+    """Build the parse cache key for a config file.
+
+    Args:
+        path (str): Path to config file
+        kind (str): Config format, used in the error message
+
+    Raises:
+        JamConfigurationError: If file not found
+
+    Returns:
+        tuple[str, int, int]: Absolute path, mtime in ns and size
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise JamConfigurationError(
+            message=f"{kind} config file not found at: {path}",
+            error_code="configuration.file_not_found",
+        )
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> tuple[Any, bool]:
+    """Parse a YAML file, cached until its mtime or size changes.
+
+    Environment variables are not substituted here, so the cached tree
+    stays valid when the environment changes.
+
+    Args:
+        path (str): Absolute path to config file
+        mtime_ns (int): File mtime, part of the cache key
+        size (int): File size, part of the cache key
+
+    Returns:
+        tuple[Any, bool]: Parsed YAML document and whether the file
+            contains `$` at all
+    """
+    import yaml
 
     try:
         with open(path) as file:
-            config = yaml.load(file, Loader=EnvVarLoader)
-        if not config:
-            return {}
-        return config[pointer] if pointer in config else config
+            raw = file.read()
+        # libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(raw, Loader=loader), "$" in raw
     except FileNotFoundError:
         raise JamConfigurationError(
             message=f"YAML config file not found at: {path}",
@@ -108,6 +168,116 @@ def __yaml_config_parser(
         )
 
 
+@lru_cache(maxsize=128)
+def _load_toml_cached(
+    path: str, mtime_ns: int, size: int
+) -> tuple[dict[str, Any], bool]:
+    """Parse a TOML file, cached until its mtime or size changes.
+
+    Args:
+        path (str): Absolute path to config file
+        mtime_ns (int): File mtime, part of the cache key
+        size (int): File size, part of the cache key
+
+    Returns:
+        tuple[dict[str, Any], bool]: Parsed TOML document and whether the
+            file contains `$` at all
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib as toml
+    else:
+        import toml  # type: ignore
+
+    try:
+        with open(path, "rb") as file:
+            raw = file.read().decode("utf-8")
+        return toml.loads(raw), "$" in raw
+    except FileNotFoundError:
+        raise JamConfigurationError(
+            message=f"TOML config file not found at: {path}",
+            error_code="configuration.file_not_found",
+        )
+    except Exception as e:
+        raise JamConfigurationError(
+            message=f"Error parsing TOML file: {e}",
+            error_code="configuration.toml_error",
+        )
+
+
+@lru_cache(maxsize=128)
+def _load_json_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    encoder: BaseEncoder | type[BaseEncoder],
+) -> tuple[Any, bool]:
+    """Parse a JSON file, cached until its mtime or size changes.
+
+    Args:
+        path (str): Absolute path to config file
+        mtime_ns (int): File mtime, part of the cache key
+        size (int): File size, part of the cache key
+        encoder (BaseEncoder | type[BaseEncoder]): Encoder to use for parsing
+
+    Returns:
+        tuple[Any, bool]: Parsed JSON document and whether the file
+            contains `$` at all
+    """
+    try:
+        with open(path) as f:
+            content = f.read()
+    except FileNotFoundError:
+        raise JamConfigurationError(
+            message=f"JSON config file not found at: {path}",
+            error_code="configuration.file_not_found",
+        )
+
+    try:
+        return encoder.loads(content), "$" in content
+    except Exception as e:
+        raise JamConfigurationError(
+            message=f"Error parsing JSON file: {e}",
+            error_code="configuration.json_parse_error",
+        ) from e
+
+
+def __yaml_config_parser(
+    path: str, pointer: str = GENERIC_POINTER
+) -> dict[str, Any]:
+    """Private method for parsing YML config with env substitution.
+
+    Supports:
+    - ${VAR} - environment variable (required)
+    - ${VAR:-default} - environment variable with default value
+    - $VAR - short form (required)
+
+    Args:
+        path (str): Path to config.yml
+        pointer (str): Pointer to config section to read.
+
+    Raises:
+        JamConfigurationError: If pyyaml not installed, file not found, or invalid YAML
+
+    Returns:
+        dict[str, Any]: Parsed YAML section with environment variable substitution.
+    """
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        raise JamConfigurationError(
+            message="To generate a configuration file from YAML/YML, you need to install PyYaml: "
+            "`pip install pyyaml` or `pip install jamlib[yaml]`",
+            error_code="configuration.import_error",
+        )
+
+    config, has_env = _load_yaml_cached(*_file_signature(path, "YAML"))
+    if not config:
+        return {}
+    if pointer in config:
+        config = config[pointer]
+    return _substitute_env_tree(config) if has_env else _copy_tree(config)
+
+
 def __toml_config_parser(
     path: str = "pyproject.toml", pointer: str = GENERIC_POINTER
 ) -> dict[str, Any]:
@@ -128,11 +298,9 @@ def __toml_config_parser(
     Returns:
         (dict[str, Any]): Dict with config param
     """
-    if sys.version_info >= (3, 11):
-        import tomllib as toml
-    else:
+    if sys.version_info < (3, 11):
         try:
-            import toml  # type: ignore
+            import toml  # type: ignore # noqa: F401
         except ImportError:
             raise JamConfigurationError(
                 message="To parse TOML config files, install toml: "
@@ -140,78 +308,15 @@ def __toml_config_parser(
                 error_code="configuration.toml_not_installed",
             )
 
-    try:
-        if sys.version_info >= (3, 11):
-            with open(path, "rb") as file:
-                config = toml.load(file)
-        else:
-            with open(path) as file:
-                config = toml.load(file)
-    except FileNotFoundError:
-        raise JamConfigurationError(
-            message=f"TOML config file not found at: {path}",
-            error_code="configuration.file_not_found",
-        )
-    except Exception as e:
-        raise JamConfigurationError(
-            message=f"Error parsing TOML file: {e}",
-            error_code="configuration.toml_error",
-        )
-
-    env_pattern = re.compile(
-        r"\$\{([^}^{]+?)(:-([^}]+))?\}|\$([A-Za-z_][A-Za-z0-9_]*)"
-    )
-
-    def _env_constructor(value: Any) -> Any:
-        """Recursively substitute ${VAR:-default}, ${VAR} and $VAR in strings."""
-        if isinstance(value, str):
-
-            def replace_env(match):
-                if match.group(1):
-                    var_name = match.group(1)
-                    default_value = (
-                        match.group(3) if match.group(3) is not None else None
-                    )
-                    env_value = os.getenv(var_name)
-
-                    if env_value is None:
-                        if default_value is not None:
-                            return default_value
-                        raise JamConfigurationError(
-                            message=f"Environment variable '{var_name}' not set and no default provided",
-                            error_code="configuration.env_var_not_set",
-                        )
-                    return env_value
-                elif match.group(4):
-                    var_name = match.group(4)
-                    env_value = os.getenv(var_name)
-                    if env_value is None:
-                        raise JamConfigurationError(
-                            message=f"Environment variable '{var_name}' not set",
-                            error_code="configuration.env_vat_not_set",
-                        )
-                    return env_value
-                return match.group(0)
-
-            return env_pattern.sub(replace_env, value)
-        elif isinstance(value, dict):
-            return {k: _env_constructor(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [_env_constructor(v) for v in value]
-        else:
-            return value
-
-    config = _env_constructor(config)
+    section, has_env = _load_toml_cached(*_file_signature(path, "TOML"))
 
     if pointer:
-        section = config
         for part in pointer.split("."):
             if isinstance(section, dict):
                 section = section.get(part, {})
             else:
                 return {}
-        return section
-    return config
+    return _substitute_env_tree(section) if has_env else _copy_tree(section)
 
 
 def __json_config_parser(
@@ -234,106 +339,8 @@ def __json_config_parser(
     Returns:
         dict[str, Any]: Parsed config with environment variable substitution
     """
-    try:
-        with open(path) as f:
-            content = f.read()
-    except FileNotFoundError:
-        raise JamConfigurationError(
-            message=f"JSON config file not found at: {path}",
-            error_code="configuration.file_not_found",
-        )
-
-    env_pattern = re.compile(
-        r"\$\{([^}^{]+?)(:-([^}]+))?\}|\$([A-Za-z_][A-Za-z0-9_]*)"
-    )
-
-    def get_env_value(var_name: str, default_value: str | None) -> str:
-        env_value = os.getenv(var_name)
-        if env_value is None:
-            if default_value is not None:
-                return default_value
-            raise JamConfigurationError(
-                message=f"Environment variable '{var_name}' not set and no default provided",
-                error_code="configuration.env_var_not_set",
-            )
-        return env_value
-
-    def find_string_boundaries(content: str) -> list[tuple[int, int]]:
-        boundaries = []
-        in_string = False
-        escaped = False
-        start = -1
-
-        for i, char in enumerate(content):
-            if escaped:
-                escaped = False
-                continue
-            if char == "\\":
-                escaped = True
-                continue
-            if char == '"':
-                if not in_string:
-                    start = i
-                    in_string = True
-                else:
-                    boundaries.append((start, i))
-                    in_string = False
-                    start = -1
-
-        return boundaries
-
-    string_boundaries = find_string_boundaries(content)
-
-    def is_in_string(pos: int) -> bool:
-        for start, end in string_boundaries:
-            if start < pos < end:
-                return True
-        return False
-
-    def replace_env_in_content(match):
-        var_name = match.group(1) or match.group(4)
-        default_value = match.group(3) if match.group(3) is not None else None
-        start_pos = match.start()
-
-        in_string = is_in_string(start_pos)
-        env_value = get_env_value(var_name, default_value)
-
-        if in_string:
-            return env_value.replace("\\", "\\\\").replace('"', '\\"')
-        else:
-            escaped_value = env_value.replace("\\", "\\\\").replace('"', '\\"')
-            return f'"{escaped_value}"'
-
-    content = env_pattern.sub(replace_env_in_content, content)
-
-    try:
-        config = encoder.loads(content)
-    except Exception as e:
-        raise JamConfigurationError(
-            message=f"Error parsing JSON file: {e}",
-            error_code="configuration.json_parse_error",
-        ) from e
-
-    def _env_constructor(value: Any) -> Any:
-        if isinstance(value, str):
-
-            def replace_env_after(match):
-                var_name = match.group(1) or match.group(4)
-                default_value = (
-                    match.group(3) if match.group(3) is not None else None
-                )
-                return get_env_value(var_name, default_value)
-
-            if env_pattern.search(value):
-                return env_pattern.sub(replace_env_after, value)
-        elif isinstance(value, dict):
-            return {k: _env_constructor(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [_env_constructor(v) for v in value]
-        return value
-
-    config = _env_constructor(config)
-    return config
+    config, has_env = _load_json_cached(*_file_signature(path, "JSON"), encoder)
+    return _substitute_env_tree(config) if has_env else _copy_tree(config)
 
 
 def __config_maker__(
@@ -349,18 +356,16 @@ def __config_maker__(
         dict[str, Any]: Parsed config
     """
     if isinstance(config, str):
-        ext = config.split(".")[-1].lower()
+        # Parsers build fresh containers on every call (the cached parse
+        # is never handed out), so their result needs no extra copy
+        ext = os.path.splitext(config)[1][1:].lower()
         match ext:
             case "yml" | "yaml":
-                result = __yaml_config_parser(
-                    path=config, pointer=pointer
-                ).copy()
+                result = __yaml_config_parser(path=config, pointer=pointer)
             case "toml":
-                result = __toml_config_parser(
-                    path=config, pointer=pointer
-                ).copy()
+                result = __toml_config_parser(path=config, pointer=pointer)
             case "json":
-                result = __json_config_parser(path=config).copy()
+                result = __json_config_parser(path=config)
             case _:
                 raise JamConfigurationError(
                     message="YML/YAML, TOML or JSON configs only!",
@@ -396,9 +401,13 @@ def __apply_jwt_config_migration__(config: dict) -> dict:
     return config
 
 
+@lru_cache(maxsize=256)
 def __module_loader__(path: str) -> Callable:
     """Loader custom modules from config.
 
+    Results are cached per path: factories like `create_instance` may run
+    per request, and modules are process-global anyway.
+
     Args:
         path (str): Path to module. For example: `my_app.classes.SomeClass`
 
@@ -424,7 +433,8 @@ def __key_loader__(key: str) -> str:
     Returns:
         str: Loaded key or original key if not a file path.
     """
-    if os.path.isfile(key):
+    # PEM material is never a path, skip the stat() for it
+    if not key.startswith("-----") and os.path.isfile(key):
         with open(key) as f:
             return f.read().strip()
     return key
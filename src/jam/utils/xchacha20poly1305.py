@@ -2,49 +2,77 @@
 
 import struct
 
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 
 
+try:
+    from nacl.bindings import (
+        crypto_aead_xchacha20poly1305_ietf_decrypt as _sodium_decrypt,
+    )
+    from nacl.bindings import (
+        crypto_aead_xchacha20poly1305_ietf_encrypt as _sodium_encrypt,
+    )
+    from nacl.exceptions import CryptoError
+except ImportError:
+    # PyNaCl is optional: without it HChaCha20 runs in Python and only the
+    # ChaCha20-Poly1305 part goes through OpenSSL.
+    _sodium_decrypt = _sodium_encrypt = None
+
+
+# Column rounds, then diagonal rounds
+_QUARTER_ROUNDS = (
+    (0, 4, 8, 12),
+    (1, 5, 9, 13),
+    (2, 6, 10, 14),
+    (3, 7, 11, 15),
+    (0, 5, 10, 15),
+    (1, 6, 11, 12),
+    (2, 7, 8, 13),
+    (3, 4, 9, 14),
+)
+
+
 def _hchacha20(key: bytes, nonce: bytes) -> bytes:
-    """Implements HChaCha20 as per RFC 8439 appendix B.2."""
-    constants = b"expand 32-byte k"
-
-    def rotl32(v, n):
-        return ((v << n) & 0xFFFFFFFF) | (v >> (32 - n))
-
-    def quarter_round(x, a, b, c, d):
-        x[a] = (x[a] + x[b]) & 0xFFFFFFFF
-        x[d] = rotl32(x[d] ^ x[a], 16)
-        x[c] = (x[c] + x[d]) & 0xFFFFFFFF
-        x[b] = rotl32(x[b] ^ x[c], 12)
-        x[a] = (x[a] + x[b]) & 0xFFFFFFFF
-        x[d] = rotl32(x[d] ^ x[a], 8)
-        x[c] = (x[c] + x[d]) & 0xFFFFFFFF
-        x[b] = rotl32(x[b] ^ x[c], 7)
+    """Implements HChaCha20 as per RFC 8439 appendix B.2.
 
+    Only used without PyNaCl. The quarter round is inlined and works on
+    locals, which roughly halves the cost compared to a helper call per
+    quarter round.
+    """
     # initialize state (16 words of 32 bits)
-    st = list(struct.unpack("<4I8I4I", constants + key + nonce))
+    x = list(struct.unpack("<4I8I4I", b"expand 32-byte k" + key + nonce))
     for _ in range(10):  # 20 rounds, 2 per iteration
-        # column rounds
-        quarter_round(st, 0, 4, 8, 12)
-        quarter_round(st, 1, 5, 9, 13)
-        quarter_round(st, 2, 6, 10, 14)
-        quarter_round(st, 3, 7, 11, 15)
-        # diagonal rounds
-        quarter_round(st, 0, 5, 10, 15)
-        quarter_round(st, 1, 6, 11, 12)
-        quarter_round(st, 2, 7, 8, 13)
-        quarter_round(st, 3, 4, 9, 14)
+        for a, b, c, d in _QUARTER_ROUNDS:
+            xa = (x[a] + x[b]) & 0xFFFFFFFF
+            xd = x[d] ^ xa
+            xd = ((xd << 16) & 0xFFFFFFFF) | (xd >> 16)
+            xc = (x[c] + xd) & 0xFFFFFFFF
+            xb = x[b] ^ xc
+            xb = ((xb << 12) & 0xFFFFFFFF) | (xb >> 20)
+            xa = (xa + xb) & 0xFFFFFFFF
+            xd ^= xa
+            xd = ((xd << 8) & 0xFFFFFFFF) | (xd >> 24)
+            xc = (xc + xd) & 0xFFFFFFFF
+            xb ^= xc
+            x[a] = xa
+            x[b] = ((xb << 7) & 0xFFFFFFFF) | (xb >> 25)
+            x[c] = xc
+            x[d] = xd
 
-    return struct.pack("<8I", *st[:4], *st[12:])
+    return struct.pack("<8I", *x[:4], *x[12:])
 
 
 def xchacha20poly1305_encrypt(
     key: bytes, nonce: bytes, plaintext: bytes, aad: bytes
 ) -> bytes:
     """Emulates XChaCha20-Poly1305 AEAD using cryptography's ChaCha20Poly1305."""
+    if len(key) != 32:
+        raise ValueError("XChaCha20 key must be 32 bytes")
     if len(nonce) != 24:
         raise ValueError("XChaCha20 nonce must be 24 bytes")
+    if _sodium_encrypt is not None:
+        return _sodium_encrypt(plaintext, aad, nonce, key)
     subkey = _hchacha20(key, nonce[:16])
     chacha_nonce = b"\x00\x00\x00\x00" + nonce[16:24]  # 12-byte nonce
     return ChaCha20Poly1305(subkey).encrypt(chacha_nonce, plaintext, aad)
@@ -53,9 +81,28 @@ def xchacha20poly1305_encrypt(
 def xchacha20poly1305_decrypt(
     key: bytes, nonce: bytes, ciphertext: bytes, aad: bytes
 ) -> bytes:
-    """Decrypt counterpart."""
+    """Decrypt counterpart.
+
+    The tag is checked in constant time by libsodium or OpenSSL, a
+    mismatch always surfaces as `InvalidTag` whichever backend is used.
+
+    Raises:
+        ValueError: If key, nonce or ciphertext has a wrong length
+        InvalidTag: If authentication fails
+    """
+    if len(key) != 32:
+        raise ValueError("XChaCha20 key must be 32 bytes")
     if len(nonce) != 24:
         raise ValueError("XChaCha20 nonce must be 24 bytes")
+    if _sodium_decrypt is not None:
+        # PyNaCl only takes bytes; bytes() is a no-op for bytes input
+        try:
+            return _sodium_decrypt(bytes(ciphertext), aad, nonce, key)
+        except (TypeError, ValueError):
+            # nacl's argument errors subclass CryptoError too
+            raise
+        except CryptoError:
+            raise InvalidTag from None
     subkey = _hchacha20(key, nonce[:16])
     chacha_nonce = b"\x00\x00\x00\x00" + nonce[16:24]
     return ChaCha20Poly1305(subkey).decrypt(chacha_nonce, ciphertext, aad)
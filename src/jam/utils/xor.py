@@ -14,6 +14,9 @@ def xor_my_data(data: str, key: str) -> str:
         data (str): The plain text string to be encrypted.
         key (str): The secret key used for encryption.
 
+    Raises:
+        ValueError: If the key is empty and there is data to encrypt.
+
     Returns:
         str: The encrypted data represented as a hexadecimal string.
 
@@ -26,10 +29,15 @@ def xor_my_data(data: str, key: str) -> str:
     """
     data_bytes = data.encode("utf-8")
     key_bytes = key.encode("utf-8")
-
-    encrypted_bytes = bytearray()
-    for i in range(len(data_bytes)):
-        encrypted_byte = data_bytes[i] ^ key_bytes[i % len(key_bytes)]
-        encrypted_bytes.append(encrypted_byte)
-
-    return encrypted_bytes.hex()
+    size = len(data_bytes)
+    if not size:
+        return ""
+    if not key_bytes:
+        raise ValueError("XOR key must not be empty")
+
+    # XOR the whole buffer as one big integer instead of byte by byte
+    key_stream = (key_bytes * (size // len(key_bytes) + 1))[:size]
+    encrypted = int.from_bytes(data_bytes, "big") ^ int.from_bytes(
+        key_stream, "big"
+    )
+    return encrypted.to_bytes(size, "big").hex()
@@ -1,11 +1,38 @@
 # -*- coding: utf-8 -*-
 
-import asyncio
+import sys
 
 from fakeredis import FakeStrictRedis
 from pytest import fixture
 
-from jam.tests import TestAsyncJam
+from jam.tests import TestAsyncJam, TestJam
+
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+if uvloop is not None and sys.platform != "win32":
+
+    @fixture(scope="session")
+    def event_loop_policy():
+        # Run pytest-asyncio tests on uvloop when it is installed
+        return uvloop.EventLoopPolicy()
+
+
+@fixture(scope="session")
+def jam_singleton() -> TestJam:
+    # Building a Jam instance is not free, so one is shared by the whole
+    # session. Its session store is shared too: tests that clear or count
+    # sessions must build their own client instead
+    return TestJam()
+
+
+@fixture(scope="session")
+def async_jam_singleton() -> TestAsyncJam:
+    return TestAsyncJam()
 
 
 # @fixture(scope="function")
@@ -15,7 +42,6 @@ from jam.tests import TestAsyncJam
 
 def _async_mock(self, return_value=None):
     async def _mock(*args, **kwargs):
-        await asyncio.sleep(0)
         return return_value
 
     return _mock
@@ -18,12 +18,12 @@ from jam.sessions import create_instance as create_session
 from jam.exceptions import JamFlaskPluginConfigError
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def jwt():
     return JWT(alg="HS256", secret_key="test_secret")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def token(jwt: JWT) -> str:
     return jwt.encode(payload={"user_id": 123})
 
@@ -38,13 +38,13 @@ def session():
         os.remove(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def paseto():
     key = base64.urlsafe_b64encode(b"12345678901234567890123456789012").decode()
     return create_paseto(version="v4", purpose="local", secret_key=key)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def paseto_token(paseto) -> str:
     return paseto.encode({"user_id": 123})
 
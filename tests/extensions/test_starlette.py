@@ -15,6 +15,13 @@ from jam.ext.starlette import (
 )
 
 
+_BASE_SCOPE = {"type": "http"}
+
+
+def _conn(headers=()):
+    return HTTPConnection({**_BASE_SCOPE, "headers": list(headers)})
+
+
 @pytest.fixture
 def jwt_config():
     return {"jwt": {"secret": "test-secret", "alg": "HS256"}}
@@ -37,45 +44,41 @@ def paseto_config():
 
 
 @pytest.mark.asyncio
-async def test_jwt_backend_from_cookie(jwt_config):
-    backend = JWTBackend(config=jwt_config, cookie_name="access_token")
+@pytest.mark.parametrize(
+    ("backend_kwargs", "header", "payload"),
+    [
+        (
+            {"cookie_name": "access_token"},
+            (b"cookie", b"access_token=valid_token"),
+            {"user_id": 1, "username": "bob"},
+        ),
+        (
+            {"header_name": "Authorization"},
+            (b"authorization", b"Bearer valid_token"),
+            {"user": "header_user"},
+        ),
+    ],
+    ids=["cookie", "header"],
+)
+async def test_jwt_backend_token(jwt_config, backend_kwargs, header, payload):
+    backend = JWTBackend(config=jwt_config, **backend_kwargs)
 
     mock_jwt = MagicMock()
-    mock_jwt.decode.return_value = {"user_id": 1, "username": "bob"}
+    mock_jwt.decode.return_value = payload
     backend._auth = mock_jwt
 
-    conn = HTTPConnection(
-        {"type": "http", "headers": [(b"cookie", b"access_token=valid_token")]}
-    )
-
-    result = await backend.authenticate(conn)
+    result = await backend.authenticate(_conn([header]))
 
     assert result is not None
     creds, user = result
     assert creds.scopes == ["authenticated"]
-    assert user.payload["user_id"] == 1  # type: ignore[attr-defined]
-
-
-@pytest.mark.asyncio
-async def test_jwt_backend_from_header(jwt_config):
-    backend = JWTBackend(config=jwt_config, header_name="Authorization")
-
-    mock_jwt = MagicMock()
-    mock_jwt.decode.return_value = {"user": "header_user"}
-    backend._auth = mock_jwt
-
-    conn = HTTPConnection(
-        {"type": "http", "headers": [(b"authorization", b"Bearer valid_token")]}
-    )
-
-    creds, user = await backend.authenticate(conn)  # type: ignore[union-attr]
-    assert user.payload == {"user": "header_user"}  # type: ignore[attr-defined]
+    assert user.payload == payload  # type: ignore[attr-defined]
 
 
 @pytest.mark.asyncio
 async def test_jwt_backend_no_token_returns_unauthenticated(jwt_config):
     backend = JWTBackend(config=jwt_config, cookie_name="access_token")
-    conn = HTTPConnection({"type": "http", "headers": []})
+    conn = _conn()
 
     result = await backend.authenticate(conn)
 
@@ -93,90 +96,68 @@ async def test_jwt_backend_invalid_token_raises_error(jwt_config):
     mock_jwt.decode.side_effect = ValueError("Invalid token")
     backend._auth = mock_jwt
 
-    conn = HTTPConnection(
-        {"type": "http", "headers": [(b"authorization", b"Bearer bad")]}
-    )
+    conn = _conn([(b"authorization", b"Bearer bad")])
 
     with pytest.raises(ValueError):
         await backend.authenticate(conn)
 
 
 @pytest.mark.asyncio
-async def test_session_backend_from_cookie(session_config):
-    backend = SessionBackend(config=session_config, cookie_name="sessionId")
-
-    mock_session = AsyncMock()
-    mock_session.get.return_value = {"user_id": 42, "role": "admin"}
-    backend._auth = mock_session
-
-    conn = HTTPConnection(
-        {"type": "http", "headers": [(b"cookie", b"sessionId=sid123")]}
-    )
-
-    result = await backend.authenticate(conn)
-
-    assert result is not None
-    creds, user = result
-    assert creds.scopes == ["authenticated"]
-    assert user.payload["user_id"] == 42  # type: ignore[attr-defined]
-
-
-@pytest.mark.asyncio
-async def test_session_backend_from_header(session_config):
-    backend = SessionBackend(
-        config=session_config, cookie_name=None, header_name="Authorization"
-    )
-
-    mock_session = AsyncMock()
-    mock_session.get.return_value = {"user": "header_user"}
-    backend._auth = mock_session
-
-    conn = HTTPConnection(
-        {"type": "http", "headers": [(b"authorization", b"Bearer session123")]}
-    )
-
-    creds, user = await backend.authenticate(conn)  # type: ignore[union-attr]
-    assert user.payload == {"user": "header_user"}  # type: ignore[attr-defined]
-
-
-@pytest.mark.asyncio
-async def test_session_backend_no_session_returns_unauthenticated(
-    session_config,
+@pytest.mark.parametrize(
+    ("backend_kwargs", "header", "payload"),
+    [
+        (
+            {"cookie_name": "sessionId"},
+            (b"cookie", b"sessionId=sid123"),
+            {"user_id": 42, "role": "admin"},
+        ),
+        (
+            {"cookie_name": None, "header_name": "Authorization"},
+            (b"authorization", b"Bearer session123"),
+            {"user": "header_user"},
+        ),
+    ],
+    ids=["cookie", "header"],
+)
+async def test_session_backend_session(
+    session_config, backend_kwargs, header, payload
 ):
-    backend = SessionBackend(config=session_config, cookie_name="sessionId")
+    backend = SessionBackend(config=session_config, **backend_kwargs)
 
     mock_session = AsyncMock()
-    mock_session.get.return_value = None
+    mock_session.get.return_value = payload
     backend._auth = mock_session
 
-    conn = HTTPConnection({"type": "http", "headers": []})
-
-    result = await backend.authenticate(conn)
+    result = await backend.authenticate(_conn([header]))
 
     assert result is not None
     creds, user = result
-    assert creds.scopes == []
-    assert isinstance(user, UnauthenticatedUser)
+    assert creds.scopes == ["authenticated"]
+    assert user.payload == payload  # type: ignore[attr-defined]
 
 
 @pytest.mark.asyncio
-async def test_session_backend_invalid_session_returns_unauthenticated(
-    session_config,
+@pytest.mark.parametrize(
+    ("backend_kwargs", "headers"),
+    [
+        ({"cookie_name": "sessionId"}, []),
+        (
+            {"header_name": "Authorization"},
+            [(b"authorization", b"Bearer broken")],
+        ),
+    ],
+    ids=["no_session", "invalid_session"],
+)
+async def test_session_backend_returns_unauthenticated(
+    session_config, backend_kwargs, headers
 ):
-    backend = SessionBackend(config=session_config, header_name="Authorization")
+    backend = SessionBackend(config=session_config, **backend_kwargs)
 
     mock_session = AsyncMock()
     mock_session.get.return_value = None
     backend._auth = mock_session
 
-    conn = HTTPConnection(
-        {
-            "type": "http",
-            "headers": [(b"authorization", b"Bearer broken")],
-        }
-    )
-
-    result = await backend.authenticate(conn)
+    result = await backend.authenticate(_conn(headers))
 
     assert result is not None
     creds, user = result
@@ -192,9 +173,7 @@ async def test_paseto_backend_from_cookie(paseto_config):
     mock_paseto.decode.return_value = {"user_id": 1, "username": "alice"}
     backend._auth = mock_paseto
 
-    conn = HTTPConnection(
-        {"type": "http", "headers": [(b"cookie", b"paseto=valid_paseto")]}
-    )
+    conn = _conn([(b"cookie", b"paseto=valid_paseto")])
 
     result = await backend.authenticate(conn)
 
@@ -212,12 +191,7 @@ async def test_paseto_backend_from_header(paseto_config):
     mock_paseto.decode.return_value = {"user": "paseto_user"}
     backend._auth = mock_paseto
 
-    conn = HTTPConnection(
-        {
-            "type": "http",
-            "headers": [(b"authorization", b"Bearer valid_paseto")],
-        }
-    )
+    conn = _conn([(b"authorization", b"Bearer valid_paseto")])
 
     creds, user = await backend.authenticate(conn)  # type: ignore[union-attr]
     assert user.payload == {"user": "paseto_user"}  # type: ignore[attr-defined]
@@ -226,7 +200,7 @@ async def test_paseto_backend_from_header(paseto_config):
 @pytest.mark.asyncio
 async def test_paseto_backend_no_token_returns_unauthenticated(paseto_config):
     backend = PASETOBackend(config=paseto_config, cookie_name="paseto")
-    conn = HTTPConnection({"type": "http", "headers": []})
+    conn = _conn()
 
     result = await backend.authenticate(conn)
 
@@ -246,9 +220,7 @@ async def test_paseto_backend_invalid_token_returns_unauthenticated(
     mock_paseto.decode.return_value = None
     backend._auth = mock_paseto
 
-    conn = HTTPConnection(
-        {"type": "http", "headers": [(b"authorization", b"Bearer bad_paseto")]}
-    )
+    conn = _conn([(b"authorization", b"Bearer bad_paseto")])
 
     result = await backend.authenticate(conn)
 
@@ -273,9 +245,7 @@ async def test_custom_user_class(jwt_config):
     mock_jwt.decode.return_value = {"user_id": 1, "username": "custom_user"}
     backend._auth = mock_jwt
 
-    conn = HTTPConnection(
-        {"type": "http", "headers": [(b"cookie", b"access_token=valid_token")]}
-    )
+    conn = _conn([(b"cookie", b"access_token=valid_token")])
 
     result = await backend.authenticate(conn)
 
@@ -292,7 +262,7 @@ def test_backend_requires_cookie_or_header():
 
 def test_jwt_backend_sets_state(jwt_config):
     backend = JWTBackend(config=jwt_config, cookie_name="access_token")
-    conn = HTTPConnection({"type": "http", "headers": []})
+    conn = _conn()
 
     import asyncio
 
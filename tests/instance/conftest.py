@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+
+from fakeredis import FakeAsyncRedis, FakeRedis
+from pytest import fixture
+
+
+@fixture(scope="session")
+def shared_fake_redis():
+    return FakeRedis()
+
+
+@fixture(scope="session")
+def shared_async_fake_redis():
+    return FakeAsyncRedis()
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 import pytest
-from fakeredis import FakeAsyncRedis
 from pytest_asyncio import fixture
 
 from jam.aio import Jam
@@ -14,12 +13,13 @@ async def jam_jwt_instance():
 
 
 @fixture
-async def jam_session_instance():
+async def jam_session_instance(shared_async_fake_redis):
+    await shared_async_fake_redis.flushdb()
     jam = Jam(
         config={
             "session": {
                 "sessions_type": "redis",
-                "redis_uri": FakeAsyncRedis(decode_responses=True),
+                "redis_uri": shared_async_fake_redis,
             }
         }
     )
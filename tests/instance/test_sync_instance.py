@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 import pytest
-from fakeredis import FakeRedis
 
 from jam import Jam
 
@@ -13,12 +12,13 @@ def jam_jwt_instance():
 
 
 @pytest.fixture
-def jam_session_instance():
+def jam_session_instance(shared_fake_redis):
+    shared_fake_redis.flushdb()
     jam = Jam(
         config={
             "session": {
                 "sessions_type": "redis",
-                "redis_uri": FakeRedis(decode_responses=True),
+                "redis_uri": shared_fake_redis,
             }
         }
     )
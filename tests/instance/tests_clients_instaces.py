@@ -1,20 +1,25 @@
 # -*- coding: utf-8 -*-
 
 import pytest
-from pytest_asyncio import fixture
 
 from jam.tests import TestAsyncJam, TestJam
 from jam.tests.fakers import invalid_token
 
 
 @pytest.fixture
-def client_instance() -> TestJam:
-    return TestJam()
+def client_instance(jam_singleton) -> TestJam:
+    return jam_singleton
+
 
+@pytest.fixture
+def async_client_instance(async_jam_singleton) -> TestAsyncJam:
+    return async_jam_singleton
 
-@fixture
-async def async_client_instance() -> TestAsyncJam:
-    return TestAsyncJam()
+
+@pytest.fixture
+def fresh_client() -> TestJam:
+    # Not the shared singleton: session_clear wipes the whole session key
+    return TestJam()
 
 
 def test_client_instance(client_instance):
@@ -98,3 +103,15 @@ async def test_async_client_instance(async_client_instance):
         )
         is False
     )
+
+
+def test_client_session_clear(fresh_client):
+    first = fresh_client.session_create(session_key="TEST", data={"n": 1})
+    reworked = fresh_client.session_rework(first)
+    other = fresh_client.session_create(session_key="OTHER", data={"n": 2})
+
+    fresh_client.session_clear("TEST")
+
+    assert fresh_client.session_get(first) is None
+    assert fresh_client.session_get(reworked) is None
+    assert fresh_client.session_get(other) == {"n": 2}
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from pytest import fixture
 
 from jam.paseto.v1 import PASETOv1
@@ -42,3 +44,65 @@ def test_encode_public_paseto(public_paseto, rsa_keys):
     verifier = PASETOv1.key(purpose="public", secret_key=rsa_keys["public"])
     decoded_payload, _ = verifier.decode(token)
     assert decoded_payload == payload
+
+
+def test_public_key_with_leading_newline(rsa_keys):
+    signer = PASETOv1.key(
+        purpose="public", secret_key="\n" + rsa_keys["private"]
+    )
+    verifier = PASETOv1.key(
+        purpose="public", secret_key="\n" + rsa_keys["public"]
+    )
+    token = signer.encode({"data": "test"})
+    decoded_payload, _ = verifier.decode(token)
+    assert decoded_payload == {"data": "test"}
+    assert PASETOv1.load_rsa_key("\n" + rsa_keys["private"]) is not None
+
+
+def _der_keys(rsa_keys):
+    private_key = serialization.load_pem_private_key(
+        rsa_keys["private"].encode(), password=None
+    )
+    public_key = private_key.public_key()
+    der = serialization.Encoding.DER
+    private_der = {
+        fmt: private_key.private_bytes(der, fmt, serialization.NoEncryption())
+        for fmt in (
+            serialization.PrivateFormat.TraditionalOpenSSL,  # PKCS#1
+            serialization.PrivateFormat.PKCS8,
+        )
+    }
+    public_der = {
+        fmt: public_key.public_bytes(der, fmt)
+        for fmt in (
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+            serialization.PublicFormat.PKCS1,
+        )
+    }
+    return private_der, public_der
+
+
+def test_load_rsa_key_der(rsa_keys):
+    private_der, public_der = _der_keys(rsa_keys)
+
+    for key in private_der.values():
+        assert PASETOv1._sniff_key(key) == (False, True)
+        assert isinstance(PASETOv1.load_rsa_key(key), rsa.RSAPrivateKey)
+    for key in public_der.values():
+        assert PASETOv1._sniff_key(key) == (False, False)
+        assert isinstance(
+            PASETOv1.load_rsa_key(key, private=False), rsa.RSAPublicKey
+        )
+
+
+def test_public_paseto_der_keys(rsa_keys):
+    private_der, public_der = _der_keys(rsa_keys)
+
+    for private_key in private_der.values():
+        signer = PASETOv1.key(purpose="public", secret_key=private_key)
+        token = signer.encode({"data": "test"})
+        for public_key in public_der.values():
+            verifier = PASETOv1.key(purpose="public", secret_key=public_key)
+            assert verifier._secret is None
+            decoded_payload, _ = verifier.decode(token)
+            assert decoded_payload == {"data": "test"}
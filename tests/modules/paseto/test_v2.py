@@ -59,3 +59,8 @@ def test_decode_token_by_public_key(public_paseto, public_paseto_no_private):
 
     with raises(JamPASETOInvalidED25519Key):
         public_paseto_no_private.encode({"user": "error"})
+
+
+def test_local_nonces_are_unique(local_paseto):
+    tokens = {local_paseto.encode({"data": "test"}) for _ in range(300)}
+    assert len(tokens) == 300
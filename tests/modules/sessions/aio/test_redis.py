@@ -9,9 +9,16 @@ from pytest_asyncio import fixture
 from jam.aio.sessions.redis import RedisSessions
 
 
-@fixture(scope="function")
-async def fake_redis():
-    return FakeAsyncRedis(decode_responses=True)
+@pytest.fixture(scope="module")
+def fake_redis():
+    # Built once per module, emptied after every test by _clean_redis
+    return FakeAsyncRedis()
+
+
+@fixture(autouse=True)
+async def _clean_redis(fake_redis):
+    yield
+    await fake_redis.flushdb()
 
 
 @fixture(scope="function")
@@ -24,15 +31,15 @@ async def redis_session_instance_no_crypt(fake_redis):
     )
 
 
-@fixture
-async def aes_key():
+@pytest.fixture(scope="session")
+def aes_key():
     from jam.utils import generate_aes_key
 
     return generate_aes_key()
 
 
-@fixture
-async def f(aes_key):
+@pytest.fixture(scope="session")
+def f(aes_key):
     return Fernet(aes_key)
 
 
@@ -55,11 +62,11 @@ async def test_create_new_session(redis_session_instance_no_crypt, fake_redis):
 
     assert isinstance(session, str)
     assert len(session) > 0
-    assert (session.split(":")[0]) == "test"
+    assert session.startswith("test:")
 
     stored_data = await fake_redis.hget(name="test:test", key=session)
 
-    assert stored_data == '{"user_id": 1}'
+    assert stored_data == b'{"user_id": 1}'
 
 
 @pytest.mark.asyncio
@@ -118,6 +125,45 @@ async def test_update_nonexistent_session(redis_session_instance_no_crypt):
         )
 
 
+def _race_after_read(monkeypatch, fake_redis, method, action):
+    """Await `action` once, right after the watched read `method`."""
+    real_pipeline = fake_redis.pipeline
+
+    def pipeline(*args, **kwargs):
+        pipe = real_pipeline(*args, **kwargs)
+        read = getattr(pipe, method)
+
+        async def racing_read(*args, **kwargs):
+            result = await read(*args, **kwargs)
+            monkeypatch.setattr(fake_redis, "pipeline", real_pipeline)
+            await action()
+            return result
+
+        setattr(pipe, method, racing_read)
+        return pipe
+
+    monkeypatch.setattr(fake_redis, "pipeline", pipeline)
+
+
+@pytest.mark.asyncio
+async def test_update_does_not_revive_deleted_session(
+    redis_session_instance_no_crypt, fake_redis, monkeypatch
+):
+    session = await redis_session_instance_no_crypt.create(
+        session_key="test", data={"user_id": 1}
+    )
+    _race_after_read(
+        monkeypatch,
+        fake_redis,
+        "hexists",
+        lambda: redis_session_instance_no_crypt.delete(session),
+    )
+
+    with pytest.raises(JamSessionNotFound):
+        await redis_session_instance_no_crypt.update(session, {"user_id": 2})
+    assert await redis_session_instance_no_crypt.get(session) is None
+
+
 @pytest.mark.asyncio
 async def test_create_session_empty_data(redis_session_instance_no_crypt):
     session = await redis_session_instance_no_crypt.create(
@@ -125,7 +171,7 @@ async def test_create_session_empty_data(redis_session_instance_no_crypt):
     )
     assert isinstance(session, str)
     assert len(session) > 0
-    assert (session.split(":")[0]) == "test"
+    assert session.startswith("test:")
     retrieved_data = await redis_session_instance_no_crypt.get(session)
     assert retrieved_data == {}
 
@@ -143,10 +189,10 @@ async def test_create_new_session_crypt(
 
     stored_data = await fake_redis.hget(name="test:test", key=session)
 
-    assert stored_data != '{"user_id": 1}'
+    assert stored_data != b'{"user_id": 1}'
 
-    assert stored_data.startswith("J$_")
-    stored_data = stored_data.split("J$_")[1]
+    assert stored_data.startswith(b"J$_")
+    stored_data = stored_data.removeprefix(b"J$_")
     decoded_data = f.decrypt(stored_data).decode()
     assert decoded_data == '{"user_id": 1}'
 
@@ -163,9 +209,179 @@ async def test_get_crypt_session(redis_session_with_crypt, f, fake_redis):
     assert retrieved_data == {"user_id": 1}
 
     retrieved_data_from_redis = await fake_redis.hget("test:test", session)
-    assert retrieved_data_from_redis != '{"user_id": 1}'
+    assert retrieved_data_from_redis != b'{"user_id": 1}'
     decoded_retrieved_data_from_redis = f.decrypt(
-        retrieved_data_from_redis.split("J$_")[1]
+        retrieved_data_from_redis.removeprefix(b"J$_")
     ).decode()
 
     assert decoded_retrieved_data_from_redis == '{"user_id": 1}'
+
+
+@pytest.mark.asyncio
+async def test_rework_session(redis_session_with_crypt, fake_redis):
+    redis_session_with_crypt.ttl = 20
+    session = await redis_session_with_crypt.create(
+        session_key="test", data={"user_id": 1}
+    )
+
+    new_session = await redis_session_with_crypt.rework(session)
+
+    assert new_session != session
+    assert await redis_session_with_crypt.get(session) is None
+    assert await redis_session_with_crypt.get(new_session) == {"user_id": 1}
+    assert 0 < (await fake_redis.httl("test:test", new_session))[0] <= 20
+
+
+@pytest.mark.asyncio
+async def test_rework_nonexistent_session(redis_session_instance_no_crypt):
+    with pytest.raises(JamSessionNotFound):
+        await redis_session_instance_no_crypt.rework("test:nonexistent")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rework_leaves_one_session(
+    redis_session_instance_no_crypt, fake_redis, monkeypatch
+):
+    session = await redis_session_instance_no_crypt.create(
+        session_key="test", data={"user_id": 1}
+    )
+    reworked = []
+
+    async def rework_first():
+        reworked.append(await redis_session_instance_no_crypt.rework(session))
+
+    _race_after_read(monkeypatch, fake_redis, "hget", rework_first)
+
+    with pytest.raises(JamSessionNotFound):
+        await redis_session_instance_no_crypt.rework(session)
+    assert await redis_session_instance_no_crypt.get(reworked[0]) == {
+        "user_id": 1
+    }
+    [name] = await fake_redis.keys()
+    assert await fake_redis.hlen(name) == 1
+
+
+@fixture(scope="function")
+async def redis_session_string_layout(fake_redis):
+    return RedisSessions(
+        redis_uri=fake_redis,
+        redis_sessions_key="test",
+        default_ttl=20,
+        layout="string",
+    )
+
+
+@pytest.mark.asyncio
+async def test_string_layout_roundtrip(redis_session_string_layout, fake_redis):
+    session = await redis_session_string_layout.create(
+        session_key="test", data={"user_id": 1}
+    )
+    assert await fake_redis.get(f"test:test:{session}") == b'{"user_id": 1}'
+    assert 0 < await fake_redis.ttl(f"test:test:{session}") <= 20
+
+    await redis_session_string_layout.update(session, {"user_id": 2})
+    assert await redis_session_string_layout.get(session) == {"user_id": 2}
+
+    new_session = await redis_session_string_layout.rework(session)
+    assert await redis_session_string_layout.get(session) is None
+    assert await redis_session_string_layout.get(new_session) == {"user_id": 2}
+
+    await redis_session_string_layout.delete(new_session)
+    assert await redis_session_string_layout.get(new_session) is None
+
+
+@pytest.mark.asyncio
+async def test_string_layout_missing_session(redis_session_string_layout):
+    with pytest.raises(JamSessionNotFound):
+        await redis_session_string_layout.update("test:nonexistent", {})
+    with pytest.raises(JamSessionNotFound):
+        await redis_session_string_layout.rework("test:nonexistent")
+
+
+@pytest.mark.asyncio
+async def test_string_layout_clear(redis_session_string_layout):
+    first = await redis_session_string_layout.create("test", {"n": 1})
+    other = await redis_session_string_layout.create("other", {"n": 3})
+
+    await redis_session_string_layout.clear("test")
+
+    assert await redis_session_string_layout.get(first) is None
+    assert await redis_session_string_layout.get(other) == {"n": 3}
+
+
+@pytest.mark.asyncio
+async def test_create_many_pipeline(
+    redis_session_instance_no_crypt, fake_redis
+):
+    items = [{"n": n} for n in range(1000)]
+
+    sessions = await redis_session_instance_no_crypt.create_many("test", items)
+
+    assert len(set(sessions)) == len(items)
+    for session, data in zip(sessions, items):
+        stored = await fake_redis.hget("test:test", session)
+        assert stored == f'{{"n": {data["n"]}}}'.encode()
+
+
+@pytest.mark.asyncio
+async def test_string_layout_create_many(redis_session_string_layout):
+    sessions = await redis_session_string_layout.create_many(
+        "test", [{"n": 1}, {}]
+    )
+
+    assert await redis_session_string_layout.get(sessions[0]) == {"n": 1}
+    assert await redis_session_string_layout.get(sessions[1]) == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("encoder", "stored"),
+    [("JsonEncoder", b'{"user_id": 1}'), ("OrjsonEncoder", b'{"user_id":1}')],
+)
+async def test_session_serializer(encoder, stored, fake_redis):
+    if encoder == "OrjsonEncoder":
+        pytest.importorskip("orjson")
+    from jam import encoders
+
+    sessions = RedisSessions(
+        redis_uri=fake_redis,
+        redis_sessions_key="test",
+        default_ttl=None,
+        serializer=getattr(encoders, encoder),
+    )
+    session = await sessions.create(session_key="test", data={"user_id": 1})
+
+    assert await fake_redis.hget("test:test", session) == stored
+    assert await sessions.get(session) == {"user_id": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_and_delete(redis_session_with_crypt):
+    session = await redis_session_with_crypt.create("test", {"user_id": 1})
+
+    assert await redis_session_with_crypt.get_and_delete(session) == {
+        "user_id": 1
+    }
+    assert await redis_session_with_crypt.get(session) is None
+
+
+@pytest.mark.asyncio
+async def test_get_and_delete_missing(redis_session_string_layout):
+    session = await redis_session_string_layout.create("test", {"n": 1})
+
+    assert await redis_session_string_layout.get_and_delete(session) == {"n": 1}
+    assert await redis_session_string_layout.get_and_delete(session) is None
+
+
+@pytest.mark.asyncio
+async def test_decoded_responses_client(aes_key):
+    sessions = RedisSessions(
+        redis_uri=FakeAsyncRedis(decode_responses=True),
+        redis_sessions_key="test",
+        is_session_crypt=True,
+        session_aes_secret=aes_key,
+    )
+    session = await sessions.create("test", {"user_id": 1})
+
+    assert await sessions.get(session) == {"user_id": 1}
+    assert await sessions.get_and_delete(session) == {"user_id": 1}
@@ -9,9 +9,16 @@ from pytest import fixture
 from jam.sessions.redis import RedisSessions
 
 
-@fixture(scope="function")
+@fixture(scope="module")
 def fake_redis():
-    return FakeRedis(decode_responses=True)
+    # Built once per module, emptied after every test by _clean_redis
+    return FakeRedis()
+
+
+@fixture(autouse=True)
+def _clean_redis(fake_redis):
+    yield
+    fake_redis.flushdb()
 
 
 @fixture(scope="function")
@@ -54,11 +61,11 @@ def test_create_new_session(redis_session_instance_no_crypt, fake_redis):
 
     assert isinstance(session, str)
     assert len(session) > 0
-    assert (session.split(":")[0]) == "test"
+    assert session.startswith("test:")
 
     stored_data = fake_redis.hget(name="test:test", key=session)
 
-    assert stored_data == '{"user_id": 1}'
+    assert stored_data == b'{"user_id": 1}'
 
 
 def test_get_session(redis_session_instance_no_crypt):
@@ -109,13 +116,51 @@ def test_update_nonexistent_session(redis_session_instance_no_crypt):
         )
 
 
+def _race_after_read(monkeypatch, fake_redis, method, action):
+    """Run `action` once, right after the watched read `method`."""
+    real_pipeline = fake_redis.pipeline
+
+    def pipeline(*args, **kwargs):
+        pipe = real_pipeline(*args, **kwargs)
+        read = getattr(pipe, method)
+
+        def racing_read(*args, **kwargs):
+            result = read(*args, **kwargs)
+            monkeypatch.setattr(fake_redis, "pipeline", real_pipeline)
+            action()
+            return result
+
+        setattr(pipe, method, racing_read)
+        return pipe
+
+    monkeypatch.setattr(fake_redis, "pipeline", pipeline)
+
+
+def test_update_does_not_revive_deleted_session(
+    redis_session_instance_no_crypt, fake_redis, monkeypatch
+):
+    session = redis_session_instance_no_crypt.create(
+        session_key="test", data={"user_id": 1}
+    )
+    _race_after_read(
+        monkeypatch,
+        fake_redis,
+        "hexists",
+        lambda: redis_session_instance_no_crypt.delete(session),
+    )
+
+    with pytest.raises(JamSessionNotFound):
+        redis_session_instance_no_crypt.update(session, {"user_id": 2})
+    assert redis_session_instance_no_crypt.get(session) is None
+
+
 def test_create_session_empty_data(redis_session_instance_no_crypt):
     session = redis_session_instance_no_crypt.create(
         session_key="test", data={}
     )
     assert isinstance(session, str)
     assert len(session) > 0
-    assert (session.split(":")[0]) == "test"
+    assert session.startswith("test:")
     retrieved_data = redis_session_instance_no_crypt.get(session)
     assert retrieved_data == {}
 
@@ -130,10 +175,10 @@ def test_create_new_session_crypt(redis_session_with_crypt, f, fake_redis):
 
     stored_data = fake_redis.hget(name="test:test", key=session)
 
-    assert stored_data != '{"user_id": 1}'
+    assert stored_data != b'{"user_id": 1}'
 
-    assert stored_data.startswith("J$_")
-    stored_data = stored_data.split("J$_")[1]
+    assert stored_data.startswith(b"J$_")
+    stored_data = stored_data.removeprefix(b"J$_")
     decoded_data = f.decrypt(stored_data).decode()
     assert decoded_data == '{"user_id": 1}'
 
@@ -149,9 +194,175 @@ def test_get_crypt_session(redis_session_with_crypt, f, fake_redis):
     assert retrieved_data == {"user_id": 1}
 
     retrieved_data_from_redis = fake_redis.hget("test:test", session)
-    assert retrieved_data_from_redis != '{"user_id": 1}'
+    assert retrieved_data_from_redis != b'{"user_id": 1}'
     decoded_retrieved_data_from_redis = f.decrypt(
-        retrieved_data_from_redis.split("J$_")[1]
+        retrieved_data_from_redis.removeprefix(b"J$_")
     ).decode()
 
     assert decoded_retrieved_data_from_redis == '{"user_id": 1}'
+
+
+def test_rework_session(redis_session_with_crypt, fake_redis):
+    redis_session_with_crypt.ttl = 20
+    session = redis_session_with_crypt.create(
+        session_key="test", data={"user_id": 1}
+    )
+
+    new_session = redis_session_with_crypt.rework(session)
+
+    assert new_session != session
+    assert redis_session_with_crypt.get(session) is None
+    assert redis_session_with_crypt.get(new_session) == {"user_id": 1}
+    assert 0 < fake_redis.httl("test:test", new_session)[0] <= 20
+
+
+def test_rework_nonexistent_session(redis_session_instance_no_crypt):
+    with pytest.raises(JamSessionNotFound):
+        redis_session_instance_no_crypt.rework("test:nonexistent")
+
+
+def test_concurrent_rework_leaves_one_session(
+    redis_session_instance_no_crypt, fake_redis, monkeypatch
+):
+    session = redis_session_instance_no_crypt.create(
+        session_key="test", data={"user_id": 1}
+    )
+    reworked = []
+    _race_after_read(
+        monkeypatch,
+        fake_redis,
+        "hget",
+        lambda: reworked.append(
+            redis_session_instance_no_crypt.rework(session)
+        ),
+    )
+
+    with pytest.raises(JamSessionNotFound):
+        redis_session_instance_no_crypt.rework(session)
+    assert redis_session_instance_no_crypt.get(reworked[0]) == {"user_id": 1}
+    [name] = fake_redis.keys()
+    assert fake_redis.hlen(name) == 1
+
+
+@fixture(scope="function")
+def redis_session_string_layout(fake_redis):
+    return RedisSessions(
+        redis_uri=fake_redis,
+        redis_sessions_key="test",
+        ttl=20,
+        layout="string",
+    )
+
+
+def test_string_layout_roundtrip(redis_session_string_layout, fake_redis):
+    session = redis_session_string_layout.create(
+        session_key="test", data={"user_id": 1}
+    )
+    assert fake_redis.get(f"test:test:{session}") == b'{"user_id": 1}'
+    assert 0 < fake_redis.ttl(f"test:test:{session}") <= 20
+
+    redis_session_string_layout.update(session, {"user_id": 2})
+    assert redis_session_string_layout.get(session) == {"user_id": 2}
+
+    new_session = redis_session_string_layout.rework(session)
+    assert redis_session_string_layout.get(session) is None
+    assert redis_session_string_layout.get(new_session) == {"user_id": 2}
+
+    redis_session_string_layout.delete(new_session)
+    assert redis_session_string_layout.get(new_session) is None
+
+
+def test_string_layout_missing_session(redis_session_string_layout):
+    with pytest.raises(JamSessionNotFound):
+        redis_session_string_layout.update("test:nonexistent", {})
+    with pytest.raises(JamSessionNotFound):
+        redis_session_string_layout.rework("test:nonexistent")
+
+
+def test_string_layout_clear(redis_session_string_layout):
+    first = redis_session_string_layout.create("test", {"n": 1})
+    second = redis_session_string_layout.create("test", {"n": 2})
+    other = redis_session_string_layout.create("other", {"n": 3})
+
+    redis_session_string_layout.clear("test")
+
+    assert redis_session_string_layout.get(first) is None
+    assert redis_session_string_layout.get(second) is None
+    assert redis_session_string_layout.get(other) == {"n": 3}
+
+
+def test_create_many(redis_session_with_crypt, fake_redis):
+    redis_session_with_crypt.ttl = 20
+    items = [{"n": n} for n in range(100)]
+
+    sessions = redis_session_with_crypt.create_many("test", items)
+
+    assert len(set(sessions)) == len(items)
+    for session, data in zip(sessions, items):
+        assert redis_session_with_crypt.get(session) == data
+    assert 0 < fake_redis.httl("test:test", sessions[-1])[0] <= 20
+
+
+def test_string_layout_create_many(redis_session_string_layout):
+    sessions = redis_session_string_layout.create_many("test", [{"n": 1}, {}])
+
+    assert redis_session_string_layout.get(sessions[0]) == {"n": 1}
+    assert redis_session_string_layout.get(sessions[1]) == {}
+    assert redis_session_string_layout.create_many("test", []) == []
+
+
+@pytest.mark.parametrize(
+    ("encoder", "stored"),
+    [("JsonEncoder", b'{"user_id": 1}'), ("OrjsonEncoder", b'{"user_id":1}')],
+)
+def test_session_serializer(encoder, stored, fake_redis):
+    if encoder == "OrjsonEncoder":
+        pytest.importorskip("orjson")
+    from jam import encoders
+
+    sessions = RedisSessions(
+        redis_uri=fake_redis,
+        redis_sessions_key="test",
+        ttl=None,
+        serializer=getattr(encoders, encoder),
+    )
+    session = sessions.create(session_key="test", data={"user_id": 1})
+
+    assert fake_redis.hget("test:test", session) == stored
+    assert sessions.get(session) == {"user_id": 1}
+
+
+def test_sessions_share_pool_per_uri():
+    first = RedisSessions(redis_uri="redis://localhost:6379/0")
+    second = RedisSessions(redis_uri="redis://localhost:6379/0")
+    other = RedisSessions(redis_uri="redis://localhost:6379/1")
+
+    assert first._redis.connection_pool is second._redis.connection_pool
+    assert first._redis.connection_pool is not other._redis.connection_pool
+
+
+def test_get_and_delete(redis_session_with_crypt):
+    session = redis_session_with_crypt.create("test", {"user_id": 1})
+
+    assert redis_session_with_crypt.get_and_delete(session) == {"user_id": 1}
+    assert redis_session_with_crypt.get(session) is None
+
+
+def test_get_and_delete_missing(
+    redis_session_instance_no_crypt, redis_session_string_layout
+):
+    assert redis_session_instance_no_crypt.get_and_delete("test:none") is None
+    assert redis_session_string_layout.get_and_delete("test:none") is None
+
+
+def test_decoded_responses_client(aes_key):
+    sessions = RedisSessions(
+        redis_uri=FakeRedis(decode_responses=True),
+        redis_sessions_key="test",
+        is_session_crypt=True,
+        session_aes_secret=aes_key,
+    )
+    session = sessions.create("test", {"user_id": 1})
+
+    assert sessions.get(session) == {"user_id": 1}
+    assert sessions.get_and_delete(session) == {"user_id": 1}
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import importlib
+import os
+import sys
+
+import pytest
+
+from jam.utils import b64codec
+
+
+@pytest.fixture
+def stdlib_codec(monkeypatch):
+    """Reload the codec as if pybase64 were not installed."""
+    monkeypatch.setitem(sys.modules, "pybase64", None)
+    yield importlib.reload(b64codec)
+    monkeypatch.undo()
+    importlib.reload(b64codec)
+
+
+def test_fallback_is_used(stdlib_codec):
+    assert stdlib_codec.urlsafe_b64encode.__module__ == b64codec.__name__
+    assert stdlib_codec.urlsafe_b64decode.__module__ == b64codec.__name__
+
+
+@pytest.mark.parametrize("size", range(65))
+def test_fallback_matches_stdlib(stdlib_codec, size):
+    # The 0xfb/0xff pattern encodes to '-' and '_' heavy output
+    for data in (os.urandom(size), (b"\xfb\xff\xbf" * 22)[:size]):
+        encoded = stdlib_codec.urlsafe_b64encode(data)
+        assert encoded == base64.urlsafe_b64encode(data)
+
+        for value in (encoded, encoded.decode("ascii")):
+            decoded = stdlib_codec.urlsafe_b64decode(value)
+            assert decoded == base64.urlsafe_b64decode(value) == data
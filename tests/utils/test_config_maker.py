@@ -340,6 +340,15 @@ class TestTOMLConfigParser:
         with pytest.raises(JamConfigurationError):
             _toml_parser("nonexistent.toml")
 
+    def test_toml_reparsed_after_change(self, toml_config_basic):
+        """Test that a cached config is reparsed when the file changes."""
+        config = _toml_parser(toml_config_basic)
+        config["jwt"]["alg"] = "mutated"
+        assert _toml_parser(toml_config_basic)["jwt"]["alg"] == "HS256"
+
+        Path(toml_config_basic).write_text('[jam.jwt]\nalg = "RS256"\n')
+        assert _toml_parser(toml_config_basic)["jwt"]["alg"] == "RS256"
+
 
 class TestConfigMaker:
     """Test the main config maker function."""
@@ -375,6 +384,17 @@ class TestConfigMaker:
         yield fname
         os.unlink(fname)
 
+    @pytest.fixture
+    def json_config_file(self):
+        """Create a JSON config file."""
+        content = '{"jwt": {"alg": "${JWT_ALG:-HS256}", "secret_key": "$JWT_SECRET"}}'
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write(content)
+            f.flush()
+            fname = f.name
+        yield fname
+        os.unlink(fname)
+
     def test_config_maker_with_dict(self):
         """Test config maker with dictionary input."""
         import warnings
@@ -415,6 +435,17 @@ class TestConfigMaker:
         finally:
             del os.environ["JWT_SECRET"]
 
+    def test_config_maker_with_json(self, json_config_file):
+        """Test config maker with JSON file."""
+        os.environ["JWT_SECRET"] = 'json "secret"'
+
+        try:
+            config = _config_maker(json_config_file)
+            assert config["jwt"]["alg"] == "HS256"
+            assert config["jwt"]["secret_key"] == 'json "secret"'
+        finally:
+            del os.environ["JWT_SECRET"]
+
     def test_config_maker_unsupported_format(self):
         """Test that unsupported config format raises error."""
         with pytest.raises(JamConfigurationError):
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+from cryptography.exceptions import InvalidTag
+import pytest
+
+from jam.utils import xchacha20poly1305 as xchacha
+
+
+# draft-irtf-cfrg-xchacha-03, section 2.2.1
+HCHACHA_KEY = bytes(range(32))
+HCHACHA_NONCE = bytes.fromhex("000000090000004a0000000031415927")
+HCHACHA_SUBKEY = bytes.fromhex(
+    "82413b4227b27bfed30e42508a877d73a0f9e4d58a74a853c12ec41326d3ecdc"
+)
+
+# draft-irtf-cfrg-xchacha-03, appendix A.3.1
+AEAD_KEY = bytes(range(0x80, 0xA0))
+AEAD_NONCE = bytes.fromhex("404142434445464748494a4b4c4d4e4f5051525354555657")
+AEAD_AAD = bytes.fromhex("50515253c0c1c2c3c4c5c6c7")
+AEAD_PLAINTEXT = (
+    b"Ladies and Gentlemen of the class of '99: If I could offer you only "
+    b"one tip for the future, sunscreen would be it."
+)
+AEAD_CIPHERTEXT = bytes.fromhex(
+    "bd6d179d3e83d43b9576579493c0e939572a1700252bfaccbed2902c21396cbb"
+    "731c7f1b0b4aa6440bf3a82f4eda7e39ae64c6708c54c216cb96b72e1213b452"
+    "2f8c9ba40db5d945b11b69b982c1bb9e3f3fac2bc369488f76b2383565d3fff9"
+    "21f9664c97637da9768812f615c68b13b52e"
+    "c0875924c1c7987947deafd8780acf49"
+)
+
+
+@pytest.fixture
+def pure_python(monkeypatch):
+    """Force the HChaCha20 + OpenSSL fallback used without PyNaCl."""
+    monkeypatch.setattr(xchacha, "_sodium_encrypt", None)
+    monkeypatch.setattr(xchacha, "_sodium_decrypt", None)
+
+
+def _tamper(ciphertext: bytes) -> bytes:
+    return ciphertext[:-1] + bytes([ciphertext[-1] ^ 1])
+
+
+def test_hchacha20_vector():
+    assert xchacha._hchacha20(HCHACHA_KEY, HCHACHA_NONCE) == HCHACHA_SUBKEY
+
+
+def test_pure_python_aead_vector(pure_python):
+    assert (
+        xchacha.xchacha20poly1305_encrypt(
+            AEAD_KEY, AEAD_NONCE, AEAD_PLAINTEXT, AEAD_AAD
+        )
+        == AEAD_CIPHERTEXT
+    )
+    assert (
+        xchacha.xchacha20poly1305_decrypt(
+            AEAD_KEY, AEAD_NONCE, AEAD_CIPHERTEXT, AEAD_AAD
+        )
+        == AEAD_PLAINTEXT
+    )
+
+
+def test_pure_python_tampered_tag(pure_python):
+    with pytest.raises(InvalidTag):
+        xchacha.xchacha20poly1305_decrypt(
+            AEAD_KEY, AEAD_NONCE, _tamper(AEAD_CIPHERTEXT), AEAD_AAD
+        )
+
+
+def test_nacl_and_pure_python_interoperate(monkeypatch):
+    if xchacha._sodium_encrypt is None:
+        pytest.skip("PyNaCl is not installed")
+
+    nacl_ct = xchacha.xchacha20poly1305_encrypt(
+        AEAD_KEY, AEAD_NONCE, AEAD_PLAINTEXT, AEAD_AAD
+    )
+    assert nacl_ct == AEAD_CIPHERTEXT
+    with pytest.raises(InvalidTag):
+        xchacha.xchacha20poly1305_decrypt(
+            AEAD_KEY, AEAD_NONCE, _tamper(nacl_ct), AEAD_AAD
+        )
+
+    sodium_encrypt = xchacha._sodium_encrypt
+    sodium_decrypt = xchacha._sodium_decrypt
+    monkeypatch.setattr(xchacha, "_sodium_encrypt", None)
+    monkeypatch.setattr(xchacha, "_sodium_decrypt", None)
+
+    # nacl ciphertext opens on the pure path
+    assert (
+        xchacha.xchacha20poly1305_decrypt(
+            AEAD_KEY, AEAD_NONCE, nacl_ct, AEAD_AAD
+        )
+        == AEAD_PLAINTEXT
+    )
+    pure_ct = xchacha.xchacha20poly1305_encrypt(
+        AEAD_KEY, AEAD_NONCE, b"round trip", AEAD_AAD
+    )
+
+    monkeypatch.setattr(xchacha, "_sodium_encrypt", sodium_encrypt)
+    monkeypatch.setattr(xchacha, "_sodium_decrypt", sodium_decrypt)
+
+    # and the reverse
+    assert (
+        xchacha.xchacha20poly1305_decrypt(
+            AEAD_KEY, AEAD_NONCE, pure_ct, AEAD_AAD
+        )
+        == b"round trip"
+    )
+    with pytest.raises(InvalidTag):
+        xchacha.xchacha20poly1305_decrypt(
+            AEAD_KEY, AEAD_NONCE, _tamper(pure_ct), AEAD_AAD
+        )